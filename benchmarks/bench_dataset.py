@@ -0,0 +1,87 @@
+"""
+Benchmark the construction of the metrics dataset from per-file rows, as in ``BaseMetricsExtractor.extract()``.
+
+Rows are synthetic dictionaries shaped like the output of extract (a few identifiers, and many numeric metrics).
+The ColumnarBuffer is timed at increasing sizes to show that it scales linearly. It is compared against the previous
+implementation, ``DataFrame.append`` once per row, which copies the whole frame at every row and is quadratic. The
+comparison runs only at small sizes, and only with pandas < 2 (DataFrame.append was removed in pandas 2).
+
+Usage:
+    python benchmarks/bench_dataset.py [--rows 10000 100000 1000000] [--metrics 40]
+"""
+import argparse
+import random
+import time
+import warnings
+
+import pandas as pd
+
+from repominer.metrics.dataset import ColumnarBuffer
+
+
+def make_rows(n_rows: int, n_metrics: int, seed: int = 42):
+    random.seed(seed)
+    names = [f'metric{i}' for i in range(n_metrics)]
+
+    for i in range(n_rows):
+        row = {'filepath': f'tasks/file{i % 1000}.yml', 'commit': f'{i // 1000:040x}', 'committed_at': '1609459200'}
+        row.update((name, random.randrange(100)) for name in names)
+        row['failure_prone'] = i % 7 == 0
+        yield row
+
+
+def legacy_dataset(rows):
+    """ The construction before the ColumnarBuffer """
+    dataset = pd.DataFrame()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', FutureWarning)
+        for row in rows:
+            dataset = dataset.append(row, ignore_index=True)
+
+    return dataset
+
+
+def columnar_dataset(rows):
+    buffer = ColumnarBuffer()
+    for row in rows:
+        buffer.append(row)
+
+    return buffer.to_dataframe()
+
+
+def run(build, rows):
+    start = time.perf_counter()
+    dataset = build(rows)
+    return dataset, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--metrics', type=int, default=40)
+    parser.add_argument('--legacy-rows', type=int, nargs='+', default=[500, 1000, 2000],
+                        help='dataset sizes for the comparison with the previous implementation, which is quadratic')
+    args = parser.parse_args()
+
+    if hasattr(pd.DataFrame, 'append'):
+        for n_rows in args.legacy_rows:
+            rows = list(make_rows(n_rows, args.metrics))
+            legacy, t_legacy = run(legacy_dataset, rows)
+            columnar, t_columnar = run(columnar_dataset, rows)
+            pd.testing.assert_frame_equal(legacy, columnar, check_dtype=False)
+
+            print(f'{n_rows} rows, {columnar.shape[1]} columns')
+            print(f'  append:   {t_legacy:.3f}s')
+            print(f'  columnar: {t_columnar:.3f}s ({t_legacy / t_columnar:.0f}x)')
+    else:
+        print(f'pandas {pd.__version__} has no DataFrame.append: skipping the comparison')
+
+    for n_rows in args.rows:
+        rows = list(make_rows(n_rows, args.metrics))
+        columnar, t_columnar = run(columnar_dataset, rows)
+        print(f'{n_rows} rows, {columnar.shape[1]} columns')
+        print(f'  columnar: {t_columnar:.3f}s ({t_columnar / n_rows * 1e6:.2f}us/row)')
+
+
+if __name__ == '__main__':
+    main()
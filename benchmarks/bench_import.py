@@ -0,0 +1,53 @@
+"""
+Benchmark the time to import repominer's miners in a fresh interpreter.
+
+The spaCy model and the NLTK resources are loaded on first use, so importing a miner must stay cheap for worker
+processes that never classify a commit. The benchmark fails (exit code 1) if the best import time exceeds the budget,
+or if spaCy or NLTK are imported.
+
+Usage:
+    python benchmarks/bench_import.py [--module repominer.mining.ansible] [--budget 1.5] [--repeat 5]
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+SNIPPET = '''
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'elapsed': elapsed, 'heavy': sorted(m for m in ('spacy', 'nltk') if m in sys.modules)}}))
+'''
+
+
+def measure(module: str) -> dict:
+    output = subprocess.run([sys.executable, '-c', SNIPPET.format(module=module)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--module', default='repominer.mining.ansible')
+    parser.add_argument('--budget', type=float, default=1.5, help='maximum import time, in seconds')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.repeat)]
+    best = min(run['elapsed'] for run in runs)
+    heavy = sorted({module for run in runs for module in run['heavy']})
+
+    print(f'import {args.module}: best {best:.3f}s over {args.repeat} runs (budget {args.budget:.3f}s)')
+
+    if heavy:
+        print(f'  FAIL: imported {", ".join(heavy)} at import time')
+    if best > args.budget:
+        print('  FAIL: over budget')
+
+    sys.exit(1 if heavy or best > args.budget else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+Benchmark ``BaseMiner.label()`` on a synthetic history.
+
+The repository traversal is replaced by an in-memory history, so that the benchmark only measures the labeling
+algorithm. The history is not linear: every ten commits, a side branch of three commits is merged back.
+The interval sweep is compared against the previous implementation, which checked every FixedFile at every commit
+between the last fixing-commit and the first commit of the repository.
+
+Usage:
+    python benchmarks/bench_label.py [--commits 60000] [--fixed-files 2000]
+"""
+import argparse
+import random
+import time
+
+from types import SimpleNamespace
+from unittest import mock
+
+from repominer.files import FailureProneFile, FixedFile
+from repominer.mining import base
+from repominer.mining.commits import CommitIndex
+
+
+def make_parents(n_commits: int):
+    """ Return the parent positions of each commit, with side branches of three commits merged every ten commits """
+    parents = [[]]
+
+    for i in range(1, n_commits):
+        if i % 10 == 3:
+            parents.append([i - 4])  # The main branch forks before the side branch i - 3 .. i - 1
+        elif i % 10 == 4:
+            parents.append([i - 1, i - 2])  # Merge of the main and side branches
+        else:
+            parents.append([i - 1])
+
+    return parents
+
+
+def make_history(n_commits: int, n_fixed_files: int, max_interval: int, seed: int = 42):
+    random.seed(seed)
+    hashes = [f'{i:040x}' for i in range(n_commits)]
+    fixed_files = []
+
+    for i in range(n_fixed_files):
+        fic = random.randrange(n_commits // 2, n_commits)
+        bic = random.randrange(max(fic - max_interval, n_commits // 2 - max_interval), fic)
+        fixed_files.append(FixedFile(filepath=f'tasks/file{i}.yml', fic=hashes[fic], bic=hashes[bic]))
+
+    fixing_commits = sorted({file.fic for file in fixed_files})
+    return hashes, fixed_files, fixing_commits
+
+
+class FakeRepository:
+    """ Traverse the in-memory history from from_commit back to to_commit, like Repository(order='reverse'), i.e., the
+    commits that are both ancestors of from_commit and descendants of to_commit (git rev-list --ancestry-path) """
+
+    hashes = []
+    parents = []
+
+    def __init__(self, path_to_repo, from_commit, to_commit, **kwargs):
+        self.start = self.hashes.index(from_commit)
+        self.stop = self.hashes.index(to_commit)
+
+    def traverse_commits(self):
+        ancestors = {self.start}
+        descendants = {self.stop}
+
+        for i in range(self.start, self.stop - 1, -1):
+            if i in ancestors:
+                ancestors.update(self.parents[i])
+
+        for i in range(self.stop + 1, self.start + 1):
+            if any(parent in descendants for parent in self.parents[i]):
+                descendants.add(i)
+
+        for i in range(self.start, self.stop - 1, -1):
+            if i in ancestors and i in descendants:
+                yield SimpleNamespace(hash=self.hashes[i], modified_files=[])
+
+
+def legacy_label(miner):
+    """ The labeling before the interval sweep """
+    miner.sort_commits(miner.fixing_commits)
+    renamed_files = {}
+
+    for commit in base.Repository(miner.path_to_repo, from_commit=miner.fixing_commits[-1],
+                                  to_commit=miner.commit_hashes[0], order='reverse').traverse_commits():
+        for file in miner.fixed_files:
+            idx_fic = miner.commit_hashes.index(file.fic)
+            idx_bic = miner.commit_hashes.index(file.bic)
+            idx_commit = miner.commit_hashes.index(commit.hash)
+
+            if idx_fic > idx_commit >= idx_bic:
+                yield FailureProneFile(filepath=renamed_files.get(file.filepath, file.filepath),
+                                       commit=commit.hash,
+                                       fixing_commit=file.fic)
+
+
+def run(label, miner):
+    start = time.perf_counter()
+    rows = sum(1 for _ in label(miner))
+    return rows, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--commits', type=int, default=60000)
+    parser.add_argument('--fixed-files', type=int, default=2000)
+    parser.add_argument('--max-interval', type=int, default=200)
+    parser.add_argument('--legacy-commits', type=int, default=1000,
+                        help='history size for the comparison with the previous implementation, which is quadratic')
+    args = parser.parse_args()
+
+    miner = base.BaseMiner.__new__(base.BaseMiner)
+    miner.path_to_repo = ''
+
+    with mock.patch.object(base, 'Repository', FakeRepository):
+        small = make_history(args.legacy_commits, args.fixed_files // 10, args.max_interval)
+        miner.commit_index = CommitIndex(small[0])
+        miner.fixed_files, miner.fixing_commits = small[1], small[2]
+        FakeRepository.hashes = small[0]
+        FakeRepository.parents = make_parents(len(small[0]))
+
+        rows_legacy, t_legacy = run(legacy_label, miner)
+        rows_sweep, t_sweep = run(base.BaseMiner.label, miner)
+        assert rows_legacy == rows_sweep
+        assert list(legacy_label(miner)) == list(miner.label())
+
+        print(f'{args.legacy_commits} commits, {len(miner.fixed_files)} fixed files, {rows_sweep} rows')
+        print(f'  legacy: {t_legacy:.3f}s')
+        print(f'  sweep:  {t_sweep:.3f}s ({t_legacy / t_sweep:.0f}x)')
+
+        large = make_history(args.commits, args.fixed_files, args.max_interval)
+        miner.commit_index = CommitIndex(large[0])
+        miner.fixed_files, miner.fixing_commits = large[1], large[2]
+        FakeRepository.hashes = large[0]
+        FakeRepository.parents = make_parents(len(large[0]))
+
+        rows_sweep, t_sweep = run(base.BaseMiner.label, miner)
+        print(f'{args.commits} commits, {len(miner.fixed_files)} fixed files, {rows_sweep} rows')
+        print(f'  sweep:  {t_sweep:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+import json
+import sqlite3
+
+from typing import Any, Dict, List, Optional, Set
+
+
+class SQLiteCache:
+    """
+    This is the base class of the on-disk caches, stored in a local SQLite database.
+    It is extended by concrete classes, which define their table in ``SCHEMA``.
+
+    A cache can be used as a context manager, to close the database when done:
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+        from repominer.cache import ClassificationCache
+
+        with ClassificationCache('cache.db') as cache:
+            labels = miner.get_fixing_commits(cache=cache)
+
+    """
+
+    SCHEMA = ''
+
+    def __init__(self, path: str):
+        """
+        The class constructor.
+
+        Parameters
+        ----------
+        path : str
+            The path to the database file. It is created if it does not exist.
+
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path)
+
+        with self._connection:
+            self._connection.execute(self.SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """ Close the database """
+        self._connection.close()
+
+
+class ClassificationCache(SQLiteCache):
+    """
+    This class caches the fixing categories of commits, as returned by ``FixingCommitClassifier.classify``.
+
+    Categories are keyed by commit hash and classifier fingerprint (see ``FixingCommitClassifier.fingerprint``).
+    Therefore, when the rules or the classifier change, the cached categories are ignored and commits are classified
+    again.
+    """
+
+    SCHEMA = 'CREATE TABLE IF NOT EXISTS labels (' \
+             'sha TEXT NOT NULL, ' \
+             'fingerprint TEXT NOT NULL, ' \
+             'labels TEXT NOT NULL, ' \
+             'PRIMARY KEY (sha, fingerprint))'
+
+    def load(self, fingerprint: str) -> Dict[str, List[str]]:
+        """
+        Return the cached categories for a classifier.
+
+        Parameters
+        ----------
+        fingerprint : str
+            The fingerprint of the classifier.
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            A dictionary of commit hashes and their fixing categories. Commits that are not fixing-commits map to an
+            empty list.
+
+        """
+        rows = self._connection.execute('SELECT sha, labels FROM labels WHERE fingerprint = ?', (fingerprint,))
+        return {sha: json.loads(labels) for sha, labels in rows}
+
+    def update(self, labels: Dict[str, List[str]], fingerprint: str) -> None:
+        """
+        Store the categories of some commits for a classifier.
+
+        Parameters
+        ----------
+        labels : Dict[str, List[str]]
+            A dictionary of commit hashes and their fixing categories.
+
+        fingerprint : str
+            The fingerprint of the classifier.
+
+        """
+        with self._connection:
+            self._connection.executemany('INSERT OR REPLACE INTO labels (sha, fingerprint, labels) VALUES (?, ?, ?)',
+                                         ((sha, fingerprint, json.dumps(commit_labels))
+                                          for sha, commit_labels in labels.items()))
+
+
+class BlameCache(SQLiteCache):
+    """
+    This class caches the outcome of ``git blame`` used by SZZ, i.e., the commits that last modified the lines deleted
+    or modified by a commit in a file.
+
+    Blames are keyed by commit hash, path of the file, and blame options. As commits are immutable, cached blames
+    never become stale.
+    """
+
+    SCHEMA = 'CREATE TABLE IF NOT EXISTS blames (' \
+             'sha TEXT NOT NULL, ' \
+             'path TEXT NOT NULL, ' \
+             'options TEXT NOT NULL, ' \
+             'commits TEXT NOT NULL, ' \
+             'PRIMARY KEY (sha, path, options))'
+
+    def get(self, sha: str, path: str, options: str) -> Optional[Set[str]]:
+        """
+        Return a cached blame.
+
+        Parameters
+        ----------
+        sha : str
+            The hash of the blamed commit.
+
+        path : str
+            The path of the file in the commit.
+
+        options : str
+            The blame options (e.g., ``-w``).
+
+        Returns
+        -------
+        Optional[Set[str]]
+            The hashes of the commits that last modified the lines, or None if the blame is not cached.
+
+        """
+        row = self._connection.execute('SELECT commits FROM blames WHERE sha = ? AND path = ? AND options = ?',
+                                       (sha, path, options)).fetchone()
+        return set(json.loads(row[0])) if row else None
+
+    def put(self, sha: str, path: str, options: str, commits: Set[str]) -> None:
+        """
+        Store a blame.
+
+        Parameters
+        ----------
+        sha : str
+            The hash of the blamed commit.
+
+        path : str
+            The path of the file in the commit.
+
+        options : str
+            The blame options (e.g., ``-w``).
+
+        commits : Set[str]
+            The hashes of the commits that last modified the lines.
+
+        """
+        with self._connection:
+            self._connection.execute('INSERT OR REPLACE INTO blames (sha, path, options, commits) VALUES (?, ?, ?, ?)',
+                                     (sha, path, options, json.dumps(sorted(commits))))
+
+
+class ProductMetricsCache(SQLiteCache):
+    """
+    This class caches the product metrics of files, as returned by ``BaseMetricsExtractor.get_product_metrics``.
+
+    Metrics are keyed by the blob hash of the file and the version of the product metrics (see
+    ``BaseMetricsExtractor.product_metrics_version``). As blobs are immutable, cached metrics only become stale when
+    the metrics change, in which case they are ignored and computed again.
+    """
+
+    SCHEMA = 'CREATE TABLE IF NOT EXISTS product_metrics (' \
+             'blob TEXT NOT NULL, ' \
+             'version TEXT NOT NULL, ' \
+             'metrics TEXT NOT NULL, ' \
+             'PRIMARY KEY (blob, version))'
+
+    def get(self, blob: str, version: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached metrics of a file.
+
+        Parameters
+        ----------
+        blob : str
+            The blob hash of the file.
+
+        version : str
+            The version of the product metrics.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            A dictionary of <metric, value>, or None if the metrics are not cached.
+
+        """
+        row = self._connection.execute('SELECT metrics FROM product_metrics WHERE blob = ? AND version = ?',
+                                       (blob, version)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, blob: str, version: str, metrics: Dict[str, Any]) -> None:
+        """
+        Store the metrics of a file.
+
+        Parameters
+        ----------
+        blob : str
+            The blob hash of the file.
+
+        version : str
+            The version of the product metrics.
+
+        metrics : Dict[str, Any]
+            A dictionary of <metric, value>.
+
+        """
+        with self._connection:
+            self._connection.execute('INSERT OR REPLACE INTO product_metrics (blob, version, metrics) VALUES (?, ?, ?)',
+                                     (blob, version, json.dumps(metrics)))
@@ -1,5 +1,41 @@
 import json
 from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+class LazyContent:
+    """ This class provides the content of a file, loaded on first use
+
+    It is passed to ``ignore_file`` in place of the content, so that blobs are only read when a filter needs them.
+
+    Attributes
+    ----------
+    loaded : bool
+        Whether the content has been loaded
+
+    """
+
+    def __init__(self, load: Callable[[], Optional[str]]):
+        """
+        The class constructor.
+
+        Parameters
+        ----------
+        load : Callable[[], Optional[str]]
+            A function returning the file content.
+
+        """
+        self._load = load
+        self._content = None
+        self.loaded = False
+
+    def __call__(self) -> Optional[str]:
+        """ Return the file content, loading it the first time """
+        if not self.loaded:
+            self._content = self._load()
+            self.loaded = True
+
+        return self._content
 
 
 class FixedFileEncoder(json.JSONEncoder):
@@ -1,5 +1,24 @@
+import functools
 import re
 
+from typing import Callable, Iterable, List, Optional, Union
+
+# Paths not containing 'test/', containing an Ansible directory, and terminating with .yml
+ANSIBLE_PATH_PATTERN = re.compile(r'(?!.*test/)(?=.*(?:playbooks/|meta/|tasks/|handlers/|roles/)).*\.yml', re.DOTALL)
+
+# Paths not containing 'test', and terminating with .tosca, .tosca.yaml, or .tosca.yml
+TOSCA_PATH_PATTERN = re.compile(r'(?!.*test).*\.tosca(?:\.yaml|\.yml)?', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=1 << 18)
+def _is_ansible_path(path: str) -> bool:
+    return ANSIBLE_PATH_PATTERN.fullmatch(path) is not None
+
+
+@functools.lru_cache(maxsize=1 << 18)
+def _is_tosca_path(path: str) -> bool:
+    return TOSCA_PATH_PATTERN.fullmatch(path) is not None
+
 
 def is_ansible_file(path: str) -> bool:
     """
@@ -7,19 +26,30 @@ def is_ansible_file(path: str) -> bool:
     :param path: a path
     :return: True if the path links to an Ansible file. False, otherwise
     """
-    return path \
-           and ('test/' not in path) \
-           and any(w in path for w in ['playbooks/', 'meta/', 'tasks/', 'handlers/', 'roles/']) and path.endswith('.yml')
+    return bool(path) and _is_ansible_path(path)
 
 
-def is_tosca_file(path: str, content: str = None) -> bool:
+def is_tosca_file(path: str, content: Union[str, Callable[[], Optional[str]]] = None) -> bool:
     """
     Check whether the path is a TOSCA file
     :param path: a path
-    :param content: eventually the source code
+    :param content: eventually the source code, or a function returning it (e.g., a LazyContent)
     :return: True if the path links to a TOSCA file. False, otherwise
     """
+    if callable(content):
+        content = content()
+
     if content:
         return re.match(r'^tosca_definitions_version\s*:.+', content) is not None
 
-    return path and ('test' not in path) and any(path.endswith(ext) for ext in ['.tosca', '.tosca.yaml', '.tosca.yml'])
+    return bool(path) and _is_tosca_path(path)
+
+
+def ansible_files_mask(paths: Iterable[str]) -> List[bool]:
+    """
+    Check which paths are Ansible files, e.g., in the listing of a repository's tree.
+    Results are memoized across calls, as most paths repeat from a release to the next.
+    :param paths: the paths
+    :return: a list of booleans, True where the path links to an Ansible file
+    """
+    return [bool(path) and _is_ansible_path(path) for path in paths]
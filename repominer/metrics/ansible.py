@@ -1,7 +1,10 @@
 from ansiblemetrics.import_metrics import general_metrics, playbook_metrics
 
+from typing import List, Union
+
 from .base import BaseMetricsExtractor
-from repominer.filters import is_ansible_file
+from repominer.files import LazyContent
+from repominer.filters import ansible_files_mask, is_ansible_file
 
 METRICS_TO_COMPUTE = (
     'lines_code',
@@ -20,6 +23,9 @@ METRICS_TO_COMPUTE = (
 
 class AnsibleMetricsExtractor(BaseMetricsExtractor):
 
+    METRICS_LIBRARY = 'ansiblemetrics'
+    PRODUCT_METRICS = {name: float if name in ('text_entropy', 'avg_play_size') else int for name in METRICS_TO_COMPUTE}
+
     def __init__(self, path_to_repo: str, clone_repo_to: str = None, at: str = 'release'):
         super().__init__(path_to_repo, clone_repo_to, at)
 
@@ -55,5 +61,8 @@ class AnsibleMetricsExtractor(BaseMetricsExtractor):
 
         return results
 
-    def ignore_file(self, path_to_file: str, content: str = None):
+    def select_files(self, filepaths: List[str]) -> List[bool]:
+        return ansible_files_mask(filepaths)
+
+    def ignore_file(self, path_to_file: str, content: Union[str, LazyContent] = None):
         return not is_ansible_file(path_to_file)
@@ -1,8 +1,22 @@
+import collections
+import concurrent.futures
+import copy
+import functools
+import hashlib
+import inspect
+import io
+import multiprocessing
 import os
 import pandas as pd
 import re
 
+try:
+    import importlib.metadata as importlib_metadata
+except ImportError:  # Python < 3.8
+    import importlib_metadata
+
 from typing import List
+from pydriller.domain.commit import Commit
 from pydriller.git import Git
 from pydriller.repository import Repository
 from pydriller.metrics.process.change_set import ChangeSet
@@ -13,9 +27,15 @@ from pydriller.metrics.process.contributors_experience import ContributorsExperi
 from pydriller.metrics.process.hunks_count import HunksCount
 from pydriller.metrics.process.lines_count import LinesCount
 
-from repominer.files import FailureProneFile
+from repominer.cache import ProductMetricsCache
+from repominer.files import FailureProneFile, LazyContent
+from repominer.metrics.dataset import ColumnarBuffer, RowSink, write_dataset
+from repominer.metrics.process import ProcessFacts
+
+from typing import Any, Dict, Generator, Iterable, Optional, Set, Tuple, Union
 
-from typing import Any, Dict, Set, Union
+# The state of a worker process extracting the files of releases
+_worker = {}
 
 
 def get_content(path: str) -> Union[str, None]:
@@ -42,6 +62,50 @@ def get_content(path: str) -> Union[str, None]:
         return None
 
 
+def get_blob_content(git_repo: Git, blob: str) -> Union[str, None]:
+    """ Get the content of a blob from the object store as plain text, as ``get_content`` would read the file.
+
+    Parameters
+    ----------
+    git_repo : Git
+        The repository.
+
+    blob : str
+        The blob hash.
+
+    Return
+    ------
+    str
+        The blob's content, if it can be decoded; None otherwise.
+
+    """
+    data = git_repo.repo.odb.stream(bytes.fromhex(blob)).read()
+
+    try:
+        # Same encoding and newline translation as open()
+        return io.TextIOWrapper(io.BytesIO(data)).read()
+    except UnicodeDecodeError:
+        return None
+
+
+def get_blob_hash(content: str) -> str:
+    """ Compute the blob hash of a text, as ``git hash-object`` would for a file with this content.
+
+    Parameters
+    ----------
+    content : str
+        The text.
+
+    Return
+    ------
+    str
+        The blob hash.
+
+    """
+    data = content.encode()
+    return hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+
+
 def is_remote(path_to_repo: str) -> bool:
     """ Check if the path links to a remote or local repository.
 
@@ -59,12 +123,35 @@ def is_remote(path_to_repo: str) -> bool:
     return path_to_repo.startswith("git@") or path_to_repo.startswith("https://")
 
 
+def _init_worker(extractor, lock, path_to_cache: str = None) -> None:
+    """ Initialize a worker process with the metrics extractor (see ``BaseMetricsExtractor._for_worker``), its own view
+    of the repository, and its own connection to the product metrics cache, if any """
+    # Opening the repository writes its configuration: one process at a time
+    with lock:
+        _worker['git_repo'] = Git(extractor.path_to_repo)
+
+    _worker['extractor'] = extractor
+    _worker['cache'] = ProductMetricsCache(path_to_cache) if path_to_cache else None
+
+
+def _extract_release(commit: str, product: bool) -> List[Tuple[str, Dict[str, Any]]]:
+    """ Return the files of a release and their product metrics, read from the object store in a worker process """
+    return _worker['extractor']._get_release_files(_worker['git_repo'], commit, product, checkout=False,
+                                                   cache=_worker['cache'])
+
+
 class BaseMetricsExtractor:
     """ This is the base class to extract metrics from IaC scripts.
     It is extended by concrete classes to extract metrics for specific languages (e.g., Ansible and Tosca).
 
     """
 
+    # The distribution name of the library computing the product metrics, if any (e.g., 'ansiblemetrics')
+    METRICS_LIBRARY = None
+
+    # The type (int or float) of each product metric, to save the dataset with an explicit schema
+    PRODUCT_METRICS: Dict[str, type] = {}
+
     def __init__(self, path_to_repo: str, clone_repo_to: str = None, at: str = 'release'):
         """ The class constructor.
 
@@ -125,6 +212,10 @@ class BaseMetricsExtractor:
         self.commits_at = [commit.hash for commit in repo_miner.traverse_commits()]
         self.dataset = pd.DataFrame()
 
+        # Blob hash -> product metrics of the files analysed so far
+        self._product_metrics = {}
+        self._product_metrics_version = None
+
     def get_files(self) -> Set[str]:
         """ Return all the files in the repository
 
@@ -150,6 +241,43 @@ class BaseMetricsExtractor:
 
         return files
 
+    def get_blobs(self, git_repo: Git, commit: str) -> Dict[str, str]:
+        """ Return all the files in the repository at a commit, listed from the object store (``git ls-tree``) without
+        checking it out.
+
+        As in ``get_files``, files in directories whose name contains '.git' are excluded. Symbolic links and
+        submodules are excluded as well.
+
+        Parameters
+        ----------
+        git_repo : Git
+            The repository.
+
+        commit : str
+            The commit hash.
+
+        Return
+        ------
+        Dict[str, str]
+            A dictionary of <filepath, blob hash>, where filepaths are relative to the root of repository
+
+        """
+        blobs = {}
+
+        for entry in git_repo.repo.git.ls_tree('-r', '-z', commit).split('\0'):
+            if not entry:
+                continue
+
+            info, path = entry.split('\t', 1)
+            mode, object_type, sha = info.split(' ')
+
+            if object_type != 'blob' or mode == '120000' or '.git' in os.path.dirname(path):
+                continue
+
+            blobs[path] = sha
+
+        return blobs
+
     def get_product_metrics(self, script: str) -> Dict[str, Any]:
         """ Extract source code metrics from a script.
 
@@ -166,8 +294,35 @@ class BaseMetricsExtractor:
         """
         return {}
 
+    @classmethod
+    def product_metrics_version(cls) -> str:
+        """ Return the version of the product metrics, used to key cached metrics.
+
+        It combines the version of ``METRICS_LIBRARY`` with a digest of the source code of the modules of the extractor
+        class hierarchy, which select the metrics to compute.
+
+        Return
+        ------
+        str
+            The version.
+
+        """
+        library = ''
+        if cls.METRICS_LIBRARY:
+            try:
+                library = f'{cls.METRICS_LIBRARY}=={importlib_metadata.version(cls.METRICS_LIBRARY)}'
+            except importlib_metadata.PackageNotFoundError:
+                library = f'{cls.METRICS_LIBRARY}==unknown'
+
+        sources = [inspect.getsource(inspect.getmodule(klass))
+                   for klass in cls.__mro__ if issubclass(klass, BaseMetricsExtractor)]
+        digest = hashlib.sha1('\n'.join(sources).encode()).hexdigest()
+        return f'{library}+{digest}'
+
     def get_process_metrics(self, from_commit: str, to_commit: str) -> dict:
         """ Extract process metrics for an evolution period.
+        `Note:` each metric traverses the evolution period. ``extract()`` computes the same metrics from a
+        ``ProcessFacts`` table instead, built while traversing the history once.
 
         Parameters
         ----------
@@ -205,64 +360,75 @@ class BaseMetricsExtractor:
             'dict_deletions_avg': lines_count.avg_removed()}
 
     def extract(self,
-                labeled_files: List[FailureProneFile],
+                labeled_files: Iterable[FailureProneFile],
                 product: bool = True,
                 process: bool = True,
-                delta: bool = False):
+                delta: bool = False,
+                checkout: bool = True,
+                num_processes: int = 1,
+                cache: ProductMetricsCache = None,
+                sink: RowSink = None):
         """ Extract metrics from labeled files.
 
         Parameters
         ----------
-        labeled_files : List[FailureProneFile]
-            The list of FailureProneFile objects that are used to label a script as failure-prone (1) or clean (0).
+        labeled_files : Iterable[FailureProneFile]
+            The FailureProneFile objects that are used to label a script as failure-prone (1) or clean (0), e.g., a
+            list or the generator returned by ``BaseMiner.label()``. They are consumed once.
         product: bool
             Whether to extract product metrics.
         process: bool
             Whether to extract process metrics.
         delta: bool
             Whether to extract delta metrics between two successive releases or commits.
+        checkout: bool
+            Whether to check out each release or commit, and read the files from the working tree.
+            If False, the files are listed and read from the object store, leaving the working tree untouched. This
+            also allows to extract metrics from bare clones.
+        num_processes : int
+            Number of worker processes extracting the product metrics of the releases (or commits). Default 1.
+            If greater than 1, releases are sent to a pool of processes, each reading the files from its own view of
+            the object store (as with ``checkout=False``), while the history is traversed. Delta metrics are computed
+            afterwards, merging the releases in order. The rows are the same as with a single process.
+        cache: ProductMetricsCache
+            If given, the product metrics of files already analysed by the same version of the metrics (see
+            ``product_metrics_version``) are taken from the cache, and those of the other files are stored in it.
+            Default None.
+            In any case, product metrics are computed once per file content (blob) and kept in memory, so that files
+            unchanged across releases (or commits) are analysed once.
+        sink: RowSink
+            If given, the rows of each release (or commit) are written to the sink as soon as the release is processed
+            (e.g., to a CSVSink), rather than kept in ``dataset``, which stays empty. Therefore, the memory is bounded
+            by the rows of a release, and the releases already processed are not lost if the extraction fails.
+            Default None.
 
         """
-        self.dataset = pd.DataFrame()
+        rows = ColumnarBuffer()
         git_repo = Git(self.path_to_repo)
 
-        metrics_previous_release = dict()  # Values for iac metrics in the last release
+        # Files are failure-prone by filepath and commit (see FailureProneFile.__eq__)
+        failure_prone_files = {(file.filepath, file.commit) for file in labeled_files}
 
-        for commit in Repository(self.path_to_repo, order='date-order', num_workers=1).traverse_commits():
+        metrics_previous_release = dict()  # Values for iac metrics in the last release
 
-            # To handle renaming in metrics_previous_release
-            for modified_file in commit.modified_files:
+        if num_processes > 1:
+            releases = self._extract_releases_in_pool(git_repo, product, process, num_processes, cache)
+        else:
+            releases = self._extract_releases(git_repo, product, process, checkout, cache)
 
-                old_path = modified_file.old_path
-                new_path = modified_file.new_path
+        for commit, renamed_files, process_metrics, files in releases:
 
-                if old_path != new_path and old_path in metrics_previous_release:
+            # To handle renaming in metrics_previous_release
+            for old_path, new_path in renamed_files:
+                if old_path in metrics_previous_release:
                     # Rename key old_path wit new_path
                     metrics_previous_release[new_path] = metrics_previous_release.pop(old_path)
 
-            if commit.hash not in self.commits_at:
-                continue
-
-            # Else
-            git_repo.checkout(commit.hash)
-            process_metrics = {}
-
-            if process:
-                # Extract process metrics
-                i = self.commits_at.index(commit.hash)
-                from_previous_commit = commit.hash if i == 0 else self.commits_at[i - 1]
-                to_current_commit = commit.hash  # = self.commits_at[i]
-                process_metrics = self.get_process_metrics(from_previous_commit, to_current_commit)
-
-            for filepath in self.get_files():
+            release_rows = []
 
-                file_content = get_content(os.path.join(self.path_to_repo, filepath))
+            for filepath, product_metrics in files:
 
-                if not file_content or self.ignore_file(filepath, file_content):
-                    continue
-
-                tmp = FailureProneFile(filepath=filepath, commit=commit.hash, fixing_commit='')
-                if tmp not in labeled_files:
+                if (filepath, commit.hash) not in failure_prone_files:
                     label = 0  # clean
                 else:
                     label = 1  # failure-prone
@@ -293,8 +459,7 @@ class BaseMetricsExtractor:
                     metrics['deletions_max'] = process_metrics['dict_deletions_max'].get(filepath, 0)
                     metrics['deletions_avg'] = process_metrics['dict_deletions_avg'].get(filepath, 0)
 
-                if product:
-                    metrics.update(self.get_product_metrics(file_content))
+                metrics.update(product_metrics)
 
                 if delta:
                     delta_metrics = dict()
@@ -311,11 +476,237 @@ class BaseMetricsExtractor:
                     metrics_previous_release[filepath] = metrics.copy()
                     metrics.update(delta_metrics)
 
-                self.dataset = self.dataset.append(metrics, ignore_index=True)
+                release_rows.append(metrics)
+
+            if sink is not None:
+                sink.write(release_rows)
+            else:
+                rows.extend(release_rows)
+
+        self.dataset = rows.to_dataframe()
+
+    def _get_release_files(self,
+                           git_repo: Git,
+                           commit: str,
+                           product: bool = True,
+                           checkout: bool = True,
+                           cache: ProductMetricsCache = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """ Return the files of a release (or commit) that are not ignored, and their product metrics.
+
+        Parameters
+        ----------
+        git_repo : Git
+            The repository.
+        commit : str
+            The commit hash of the release.
+        product : bool
+            Whether to extract product metrics.
+        checkout : bool
+            Whether the release is checked out, and the files are read from the working tree. Otherwise, they are
+            listed and read from the object store.
+        cache : ProductMetricsCache
+            The persistent cache of product metrics, if any.
+
+        Return
+        ------
+        List[Tuple[str, Dict[str, Any]]]
+            A list of (filepath, product metrics), where the product metrics are empty if ``product`` is False.
+
+        """
+        if checkout:
+            blobs = None
+            filepaths = list(self.get_files())
+        else:
+            blobs = self.get_blobs(git_repo, commit)
+            filepaths = list(blobs)
 
-            git_repo.reset()
+        release_files = []
 
-    def ignore_file(self, path_to_file: str, content: str = None):
+        for filepath, selected in zip(filepaths, self.select_files(filepaths)):
+
+            if not selected:
+                continue
+
+            if blobs is None:
+                blob, load = None, functools.partial(get_content, os.path.join(self.path_to_repo, filepath))
+            else:
+                blob = blobs[filepath]
+                load = functools.partial(get_blob_content, git_repo, blob)
+
+            # The content is read only if the filepath is not enough to ignore the file
+            content = LazyContent(load)
+
+            if self.ignore_file(filepath, content):
+                continue
+
+            if not product:
+                if content():
+                    release_files.append((filepath, {}))
+                continue
+
+            # Metrics are cached for files with content only: if cached, the file needs not be read
+            metrics = self._get_cached_product_metrics(blob, cache) if blob else None
+
+            if metrics is None:
+                if not content():
+                    continue
+
+                if blob is None:
+                    # The file is read from the working tree: identify it by its content
+                    blob = get_blob_hash(content())
+                    metrics = self._get_cached_product_metrics(blob, cache)
+
+                if metrics is None:
+                    metrics = self.get_product_metrics(content())
+                    self._cache_product_metrics(blob, metrics, cache)
+
+            release_files.append((filepath, metrics))
+
+        return release_files
+
+    def _get_cached_product_metrics(self, blob: str, cache: ProductMetricsCache = None) -> Optional[Dict[str, Any]]:
+        """ Return the product metrics of a blob from memory, or else from the persistent cache; None if not cached """
+        if blob in self._product_metrics:
+            return self._product_metrics[blob]
+
+        if cache is None:
+            return None
+
+        metrics = cache.get(blob, self._get_product_metrics_version())
+        if metrics is not None:
+            self._product_metrics[blob] = metrics
+
+        return metrics
+
+    def _cache_product_metrics(self, blob: str, metrics: Dict[str, Any], cache: ProductMetricsCache = None) -> None:
+        """ Store the product metrics of a blob in memory, and in the persistent cache if any """
+        self._product_metrics[blob] = metrics
+
+        if cache is not None:
+            cache.put(blob, self._get_product_metrics_version(), metrics)
+
+    def _get_product_metrics_version(self) -> str:
+        # Computed once, as it reads the source code of the extractor
+        if self._product_metrics_version is None:
+            self._product_metrics_version = self.product_metrics_version()
+
+        return self._product_metrics_version
+
+    def _traverse_releases(self, git_repo: Git, process: bool) \
+            -> Generator[Tuple[Commit, List[Tuple[str, str]], Dict[str, Any]], None, None]:
+        """ Traverse the history, and yield each release (or commit) in ``commits_at`` with the files renamed since
+        the previous one, as (old path, new path), and its process metrics (empty if ``process`` is False).
+        """
+        # The history of the commits traversed so far, to compute the process metrics without traversing it again
+        facts = ProcessFacts(git_repo)
+        renamed_files = []
+
+        for commit in Repository(self.path_to_repo, order='date-order', num_workers=1).traverse_commits():
+            modified_files = commit.modified_files
+
+            if process:
+                facts.add(commit, modified_files)
+
+            renamed_files.extend((modified_file.old_path, modified_file.new_path) for modified_file in modified_files
+                                 if modified_file.old_path != modified_file.new_path)
+
+            if commit.hash not in self.commits_at:
+                continue
+
+            process_metrics = {}
+
+            if process:
+                # Extract process metrics
+                i = self.commits_at.index(commit.hash)
+                from_previous_commit = commit.hash if i == 0 else self.commits_at[i - 1]
+                to_current_commit = commit.hash  # = self.commits_at[i]
+                process_metrics = facts.get_process_metrics(from_previous_commit, to_current_commit)
+
+            yield commit, renamed_files, process_metrics
+            renamed_files = []
+
+    def _extract_releases(self, git_repo: Git, product: bool, process: bool, checkout: bool,
+                          cache: ProductMetricsCache = None) \
+            -> Generator[Tuple[Commit, List[Tuple[str, str]], Dict[str, Any], List[Tuple[str, Dict[str, Any]]]],
+                         None, None]:
+        """ Yield each release with its renamed files, process metrics, and files with product metrics, in order """
+        for commit, renamed_files, process_metrics in self._traverse_releases(git_repo, process):
+
+            if checkout:
+                git_repo.checkout(commit.hash)
+
+            files = self._get_release_files(git_repo, commit.hash, product, checkout, cache)
+
+            if checkout:
+                git_repo.reset()
+
+            yield commit, renamed_files, process_metrics, files
+
+    def _extract_releases_in_pool(self, git_repo: Git, product: bool, process: bool, num_processes: int,
+                                  cache: ProductMetricsCache = None) \
+            -> Generator[Tuple[Commit, List[Tuple[str, str]], Dict[str, Any], List[Tuple[str, Dict[str, Any]]]],
+                         None, None]:
+        """ As ``_extract_releases``, with the files of the releases extracted by a pool of processes from the object
+        store. At most two releases per process are pending at any time, to bound the memory.
+        Each process opens its own connection to the product metrics cache, if any.
+        """
+        pending = collections.deque()
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=num_processes,
+                                                    initializer=_init_worker,
+                                                    initargs=(self._for_worker(), multiprocessing.Lock(),
+                                                              cache.path if cache is not None else None)) as executor:
+
+            for commit, renamed_files, process_metrics in self._traverse_releases(git_repo, process):
+                pending.append((commit, renamed_files, process_metrics,
+                                executor.submit(_extract_release, commit.hash, product)))
+
+                while len(pending) >= 2 * num_processes:
+                    commit, renamed_files, process_metrics, future = pending.popleft()
+                    yield commit, renamed_files, process_metrics, future.result()
+
+            while pending:
+                commit, renamed_files, process_metrics, future = pending.popleft()
+                yield commit, renamed_files, process_metrics, future.result()
+
+    def _for_worker(self) -> 'BaseMetricsExtractor':
+        """ Return the copy of the extractor sent to the processes extracting the releases with ``num_processes`` > 1.
+
+        The copy keeps the configuration of the extractor, but not the state the processes do not need: the dataset,
+        the commits, and the in-memory product metrics. Subclasses holding other large state should extend it.
+
+        Return
+        ------
+        BaseMetricsExtractor
+            A shallow copy of the extractor.
+
+        """
+        extractor = copy.copy(self)
+        extractor.dataset = pd.DataFrame()
+        extractor.commits_at = []
+        extractor._product_metrics = {}
+        return extractor
+
+    def select_files(self, filepaths: List[str]) -> List[bool]:
+        """ Select the files of a release (or commit) to consider, based on their path only.
+
+        It is called once per release with all its filepaths, before any content is read, to discard most files in
+        a batch. The selected files are then checked by ``ignore_file``. By default, all the files are selected.
+
+        Parameters
+        ----------
+        filepaths : List[str]
+            The filepaths, relative to the root of the repository.
+
+        Return
+        ------
+        List[bool]
+            A list of booleans, True where the file must be considered.
+
+        """
+        return [True] * len(filepaths)
+
+    def ignore_file(self, path_to_file: str, content: Union[str, LazyContent] = None):
         return False
 
     def to_csv(self, filepath):
@@ -330,3 +721,48 @@ class BaseMetricsExtractor:
         """
         with open(filepath, 'w') as out:
             self.dataset.to_csv(out, mode='w', index=False)
+
+    def to_parquet(self, filepath: str, partition_by_release: bool = False):
+        """ Save the metrics as Parquet, with the schema returned by ``repominer.metrics.dataset.metrics_schema``.
+        Requires pyarrow.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the file or, if partitioned by release, to the directory.
+        partition_by_release : bool
+            Whether to write a file per release (or commit). Default False.
+
+        """
+        write_dataset(self.dataset, filepath, format='parquet', partition_by_release=partition_by_release,
+                      metric_types=self.PRODUCT_METRICS)
+
+    def to_feather(self, filepath: str, partition_by_release: bool = False):
+        """ Save the metrics as Feather (compressed Arrow IPC), with the schema returned by
+        ``repominer.metrics.dataset.metrics_schema``. Requires pyarrow.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the file or, if partitioned by release, to the directory.
+        partition_by_release : bool
+            Whether to write a file per release (or commit). Default False.
+
+        """
+        write_dataset(self.dataset, filepath, format='feather', partition_by_release=partition_by_release,
+                      metric_types=self.PRODUCT_METRICS)
+
+    def to_arrow(self, filepath: str, partition_by_release: bool = False):
+        """ Save the metrics as an uncompressed Arrow IPC file, which can be memory-mapped, with the schema returned by
+        ``repominer.metrics.dataset.metrics_schema``. Requires pyarrow.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the file or, if partitioned by release, to the directory.
+        partition_by_release : bool
+            Whether to write a file per release (or commit). Default False.
+
+        """
+        write_dataset(self.dataset, filepath, format='arrow', partition_by_release=partition_by_release,
+                      metric_types=self.PRODUCT_METRICS)
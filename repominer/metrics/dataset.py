@@ -0,0 +1,405 @@
+import abc
+import csv
+import json
+import os
+import pandas as pd
+
+from typing import Any, Callable, Dict, Iterable, List
+
+from repominer.metrics.process import PROCESS_METRICS
+
+# Typed columnar formats, by file extension. Feather and Arrow are both the Arrow IPC file format, compressed (lz4)
+# and uncompressed (memory-mappable), respectively.
+COLUMNAR_FORMATS = {'.parquet': 'parquet', '.feather': 'feather', '.arrow': 'arrow'}
+
+
+class ColumnarBuffer:
+    """ This class accumulates the rows of a metrics dataset column by column, and materializes them into a
+    pandas.DataFrame at once.
+
+    Appending a row costs O(number of columns), whereas appending it to a DataFrame copies the whole frame.
+    Columns are ordered by first appearance, and missing values are None (NaN in the DataFrame), as with
+    ``DataFrame.append``.
+
+    Attributes
+    ----------
+    columns : Dict[str, List[Any]]
+        The values of each column, all of length ``num_rows``.
+    num_rows : int
+        The number of rows.
+
+    """
+
+    def __init__(self):
+        self.columns: Dict[str, List[Any]] = {}
+        self.num_rows = 0
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """ Append a row.
+
+        Parameters
+        ----------
+        row : Dict[str, Any]
+            A dictionary of <column, value>. Columns not in the buffer yet are added, with None in the previous rows.
+
+        """
+        for name, value in row.items():
+            column = self.columns.get(name)
+
+            if column is None:
+                column = self.columns[name] = [None] * self.num_rows
+
+            column.append(value)
+
+        self.num_rows += 1
+
+        if len(row) < len(self.columns):
+            # Pad the columns missing in the row
+            for column in self.columns.values():
+                if len(column) < self.num_rows:
+                    column.append(None)
+
+    def extend(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """ Append some rows.
+
+        Parameters
+        ----------
+        rows : Iterable[Dict[str, Any]]
+            The rows, as in ``append``.
+
+        """
+        for row in rows:
+            self.append(row)
+
+    def clear(self) -> None:
+        """ Remove all the rows and columns """
+        self.columns = {}
+        self.num_rows = 0
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """ Materialize the rows into a DataFrame.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The dataset, with a column per key in order of first appearance.
+
+        """
+        return pd.DataFrame(self.columns)
+
+
+class RowSink(abc.ABC):
+    """ This is the base class of the sinks the rows of a metrics dataset can be streamed to, one release (or commit)
+    at a time, as in ``BaseMetricsExtractor.extract(sink=...)``.
+
+    A sink can be used as a context manager, to close it when done:
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+        from repominer.metrics.dataset import CSVSink
+
+        with CSVSink('metrics.csv') as sink:
+            extractor.extract(labeled_files, sink=sink)
+
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @abc.abstractmethod
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        """ Write the rows of a release.
+
+        Parameters
+        ----------
+        rows : List[Dict[str, Any]]
+            The rows, as dictionaries of <column, value>. Rows may have different columns.
+
+        """
+
+    def close(self) -> None:
+        """ Close the sink """
+        pass
+
+
+class CSVSink(RowSink):
+    """ This class streams the rows of a metrics dataset to a CSV file, flushed after each release.
+
+    Columns are ordered by first appearance, and missing values are empty, as in ``ColumnarBuffer``. When a release
+    brings new columns (e.g., the delta metrics from the second release on), the file is rewritten with the new header,
+    replacing it atomically, so that it is complete after every release.
+    """
+
+    def __init__(self, path: str):
+        """ The class constructor.
+
+        Parameters
+        ----------
+        path : str
+            The path to the CSV file. It is overwritten if it exists.
+
+        """
+        self.path = path
+        self.columns: List[str] = []
+        self._file = None
+        self._writer = None
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+
+        columns = list(self.columns)
+        known_columns = set(columns)
+
+        for row in rows:
+            for name in row:
+                if name not in known_columns:
+                    known_columns.add(name)
+                    columns.append(name)
+
+        if self._file is None or columns != self.columns:
+            self._open(columns)
+
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self, columns: List[str]) -> None:
+        """ Write the header and the rows written so far to a new file, replace the current one, and open it.
+        The rows are copied one at a time, so that the memory does not grow with the file. """
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', newline='') as out:
+            writer = csv.writer(out, lineterminator='\n')
+            writer.writerow(columns)
+
+            if self._file is not None:
+                self._file.close()
+
+                padding = [''] * (len(columns) - len(self.columns))
+                with open(self.path, newline='') as current:
+                    rows = csv.reader(current)
+                    next(rows)  # The previous header
+                    for row in rows:
+                        writer.writerow(row + padding)
+
+        os.replace(tmp_path, self.path)
+
+        self.columns = columns
+        self._file = open(self.path, 'a', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=columns, restval='', lineterminator='\n')
+
+
+class JSONLinesSink(RowSink):
+    """ This class streams the rows of a metrics dataset to a JSON Lines file, one object per row, flushed after each
+    release. Rows only contain their own columns. """
+
+    def __init__(self, path: str):
+        """ The class constructor.
+
+        Parameters
+        ----------
+        path : str
+            The path to the JSON Lines file. It is overwritten if it exists.
+
+        """
+        self.path = path
+        self._file = open(path, 'w')
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            self._file.write(json.dumps(row) + '\n')
+
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CallbackSink(RowSink):
+    """ This class passes the rows of each release of a metrics dataset to a function, e.g., to store them in a
+    database. """
+
+    def __init__(self, callback: Callable[[List[Dict[str, Any]]], None]):
+        """ The class constructor.
+
+        Parameters
+        ----------
+        callback : Callable[[List[Dict[str, Any]]], None]
+            The function called with the rows of each release.
+
+        """
+        self.callback = callback
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        self.callback(rows)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError('Parquet, Feather, and Arrow files require pyarrow. '
+                          'Install it with: pip install repository-miner[arrow]')
+
+    return pyarrow
+
+
+def metrics_schema(columns: Iterable[str], metric_types: Dict[str, type] = None):
+    """ Return the explicit Arrow schema of a metrics dataset, which depends on its columns only.
+
+    Filepaths and commits are categorical (dictionary-encoded), as they repeat across rows, and the commit date is a
+    string. The label and the metrics are typed by definition: the process metrics as in ``PROCESS_METRICS``, the
+    product metrics as in ``metric_types``, and the delta metrics as the metric they are the delta of. Integer metrics
+    have nulls where the in-memory dataset has NaN (e.g., the delta metrics in the first release). Other columns are
+    floats.
+
+    Parameters
+    ----------
+    columns : Iterable[str]
+        The columns of the dataset, e.g., ``BaseMetricsExtractor.dataset.columns``.
+    metric_types : Dict[str, type]
+        The type (int or float) of each product metric, e.g., ``AnsibleMetricsExtractor.PRODUCT_METRICS``.
+        Default None.
+
+    Returns
+    -------
+    pyarrow.Schema
+        The schema, with a field per column.
+
+    """
+    pa = _import_pyarrow()
+
+    types = {'failure_prone': int, **PROCESS_METRICS, **(metric_types or {})}
+    fields = []
+
+    for name in columns:
+        if name in ('filepath', 'commit'):
+            field_type = pa.dictionary(pa.int32(), pa.string())
+        elif name == 'committed_at':
+            field_type = pa.string()
+        else:
+            metric_type = types.get(name[len('delta_'):] if name.startswith('delta_') else name, float)
+            field_type = pa.int64() if metric_type is int else pa.float64()
+
+        fields.append(pa.field(name, field_type))
+
+    return pa.schema(fields)
+
+
+def write_dataset(dataset: pd.DataFrame,
+                  path: str,
+                  format: str = 'parquet',
+                  partition_by_release: bool = False,
+                  metric_types: Dict[str, type] = None):
+    """ Save a metrics dataset as a typed columnar file, with the schema returned by ``metrics_schema``.
+
+    Parameters
+    ----------
+    dataset : pandas.DataFrame
+        The dataset, e.g., ``BaseMetricsExtractor.dataset``.
+    path : str
+        The path to the file or, if partitioned by release, to the directory. The directory is created if needed, and
+        its files of the same format are replaced.
+    format : str
+        One of 'parquet', 'feather', or 'arrow'. Default 'parquet'.
+    partition_by_release : bool
+        Whether to write a file per release (or commit), in the order of the dataset. Each file is named after the
+        position and the hash of the release (e.g., 03-9a4cb7e...parquet), and has the whole schema. Default False.
+    metric_types : Dict[str, type]
+        The type (int or float) of each product metric, as in ``metrics_schema``. Default None.
+
+    """
+    pa = _import_pyarrow()
+
+    extension = next((extension for extension, name in COLUMNAR_FORMATS.items() if name == format), None)
+    if extension is None:
+        raise ValueError(f'format must be one of {", ".join(COLUMNAR_FORMATS.values())}, not {format}')
+
+    table = pa.Table.from_pandas(dataset, schema=metrics_schema(dataset.columns, metric_types), preserve_index=False)
+
+    if not partition_by_release:
+        _write_table(table, path, format)
+        return
+
+    os.makedirs(path, exist_ok=True)
+    for filename in os.listdir(path):
+        if filename.endswith(extension):
+            os.remove(os.path.join(path, filename))
+
+    releases = pd.unique(dataset['commit'])
+    indices = dataset.groupby('commit', sort=False).indices
+    width = len(str(len(releases) - 1))
+
+    for i, commit in enumerate(releases):
+        _write_table(table.take(indices[commit]), os.path.join(path, f'{i:0{width}d}-{commit}{extension}'), format)
+
+
+def _write_table(table, path: str, format: str) -> None:
+    pa = _import_pyarrow()
+
+    if format == 'parquet':
+        pa.parquet.write_table(table, path)
+    else:
+        pa.feather.write_feather(table, path, compression='uncompressed' if format == 'arrow' else 'lz4')
+
+
+def read_dataset(path: str, columns: List[str] = None) -> pd.DataFrame:
+    """ Load a metrics dataset saved by ``write_dataset``.
+
+    The format is given by the extension of the file or, if partitioned by release, of the files in the directory.
+    Feather and Arrow files are memory-mapped.
+
+    Parameters
+    ----------
+    path : str
+        The path to the file, or to the directory of the releases.
+    columns : List[str]
+        If given, only these columns are read. Default None (all columns).
+
+    Returns
+    -------
+    pandas.DataFrame
+        The dataset, with categorical filepath and commit columns. As in memory, integer metrics with missing
+        values are floats with NaN.
+
+    """
+    pa = _import_pyarrow()
+
+    if os.path.isdir(path):
+        paths = sorted(os.path.join(path, filename) for filename in os.listdir(path)
+                       if os.path.splitext(filename)[1] in COLUMNAR_FORMATS)
+    else:
+        paths = [path]
+
+    if not paths:
+        raise FileNotFoundError(f'No Parquet, Feather, or Arrow files in {path}')
+
+    tables = []
+    for path_to_file in paths:
+        format = COLUMNAR_FORMATS.get(os.path.splitext(path_to_file)[1])
+
+        if format == 'parquet':
+            tables.append(pa.parquet.read_table(path_to_file, columns=columns))
+        elif format in ('feather', 'arrow'):
+            tables.append(pa.feather.read_table(path_to_file, columns=columns, memory_map=True))
+        else:
+            raise ValueError(f'Unknown format of {path_to_file}: the extension must be one of '
+                             f'{", ".join(COLUMNAR_FORMATS)}')
+
+    # Each release has its own dictionary of filepaths and commits
+    return pa.concat_tables(tables).unify_dictionaries().to_pandas()
@@ -0,0 +1,269 @@
+import statistics
+import pandas as pd
+
+from pydriller.domain.commit import Commit, ModificationType, ModifiedFile
+from pydriller.git import Git
+
+from typing import Any, Dict, List
+
+# Type of each process metric in the metrics dataset (see ``BaseMetricsExtractor.extract``)
+PROCESS_METRICS = {
+    'change_set_max': int,
+    'change_set_avg': float,
+    'code_churn_count': int,
+    'code_churn_max': int,
+    'code_churn_avg': float,
+    'commits_count': int,
+    'contributors_count': int,
+    'minor_contributors_count': int,
+    'highest_contributor_experience': float,
+    'hunks_median': float,
+    'additions': int,
+    'additions_max': int,
+    'additions_avg': float,
+    'deletions': int,
+    'deletions_max': int,
+    'deletions_avg': float
+}
+
+
+def count_hunks(diff: str) -> int:
+    """ Count the hunks of a diff, i.e., the continuous blocks of added or deleted lines, as PyDriller's HunksCount.
+
+    Parameters
+    ----------
+    diff : str
+        The diff of a modified file.
+
+    Returns
+    -------
+    int
+        The number of hunks.
+
+    """
+    is_hunk = False
+    hunks = 0
+
+    for line in diff.splitlines():
+        if line.startswith('+') or line.startswith('-'):
+            if not is_hunk:
+                is_hunk = True
+                hunks += 1
+        else:
+            is_hunk = False
+
+    return hunks
+
+
+def _to_dict(series: pd.Series) -> Dict[str, Any]:
+    # Python scalars, as returned by the PyDriller process metrics
+    return dict(zip(series.index.tolist(), series.tolist()))
+
+
+class ProcessFacts:
+    """ This class records the history of a repository as a fact table, in a single pass over its commits, to compute
+    the process metrics of any evolution period without traversing it again.
+
+    The table has a row per file modified by each commit, with its old and new path, whether it was added or renamed,
+    and its number of added lines, deleted lines, and hunks. The author and the number of modified files of each
+    commit are recorded as well.
+
+    The process metrics of an evolution period are derived from the rows of its commits with group-bys, and have the
+    same values as the PyDriller process metrics used by ``BaseMetricsExtractor.get_process_metrics``.
+
+    Example
+    -------
+    .. highlight:: python
+    .. code-block:: python
+
+        facts = ProcessFacts(Git(path_to_repo))
+
+        for commit in Repository(path_to_repo).traverse_commits():
+            facts.add(commit, commit.modified_files)
+
+        metrics = facts.get_process_metrics(from_commit, to_commit)
+
+    """
+
+    def __init__(self, git_repo: Git):
+        """ The class constructor.
+
+        Parameters
+        ----------
+        git_repo : Git
+            The repository.
+
+        """
+        self.git_repo = git_repo
+
+        self.old_paths: List[str] = []
+        self.new_paths: List[str] = []
+        self.added_files: List[bool] = []
+        self.renamed_files: List[bool] = []
+        self.additions: List[int] = []
+        self.deletions: List[int] = []
+        self.hunks: List[int] = []
+
+        # Commit hash -> (author email, index of the first row, index of the last row + 1)
+        self.commits: Dict[str, tuple] = {}
+
+    def add(self, commit: Commit, modified_files: List[ModifiedFile]) -> None:
+        """ Record a commit.
+
+        Parameters
+        ----------
+        commit : Commit
+            The commit.
+
+        modified_files : List[ModifiedFile]
+            The files modified by the commit, i.e., ``commit.modified_files``. They are passed explicitly because
+            PyDriller computes the diff at every access.
+
+        """
+        start = len(self.new_paths)
+
+        for modified_file in modified_files:
+            self.old_paths.append(modified_file.old_path)
+            self.new_paths.append(modified_file.new_path)
+            self.added_files.append(modified_file.change_type == ModificationType.ADD)
+            self.renamed_files.append(modified_file.change_type == ModificationType.RENAME)
+            self.additions.append(modified_file.added_lines)
+            self.deletions.append(modified_file.deleted_lines)
+            self.hunks.append(count_hunks(modified_file.diff))
+
+        self.commits[commit.hash] = (commit.author.email.strip(), start, len(self.new_paths))
+
+    def get_commits(self, from_commit: str, to_commit: str) -> List[str]:
+        """ Return the commits of an evolution period, as traversed by the PyDriller process metrics.
+
+        Parameters
+        ----------
+        from_commit : str
+            Hash of the period start.
+
+        to_commit : str
+            Hash of the period end.
+
+        Returns
+        -------
+        List[str]
+            The hashes of the commits, from the newest to the oldest. The start of the period is included.
+
+        """
+        if from_commit == to_commit:
+            return [to_commit]
+
+        start = self.git_repo.repo.commit(from_commit)
+        end = self.git_repo.repo.commit(to_commit)
+
+        # As PyDriller, swap the commits if the start does not precede the end
+        if (start.committed_datetime, start.authored_datetime) >= (end.committed_datetime, end.authored_datetime):
+            start, end = end, start
+
+        if self.git_repo.repo.git.version_info >= (2, 38):
+            return self.git_repo.repo.git.rev_list(f'--ancestry-path={start.hexsha}',
+                                                   *(f'^{parent.hexsha}' for parent in start.parents),
+                                                   end.hexsha).split()
+
+        # Before git 2.38, --ancestry-path takes no commit: the same commits are those between the start (excluded)
+        # and the end, plus the start if it is an ancestor of the end
+        commits = self.git_repo.repo.git.rev_list('--ancestry-path', f'{start.hexsha}..{end.hexsha}').split()
+        if self.git_repo.repo.is_ancestor(start.hexsha, end.hexsha):
+            commits.append(start.hexsha)
+
+        return commits
+
+    def get_process_metrics(self, from_commit: str, to_commit: str) -> Dict[str, Any]:
+        """ Compute the process metrics for an evolution period. All its commits must have been recorded.
+
+        Parameters
+        ----------
+        from_commit : str
+            Hash of the period start.
+
+        to_commit : str
+            Hash of the period end.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The same dictionary of <metric, value> as ``BaseMetricsExtractor.get_process_metrics``. Files are
+            identified by their path at the end of the period.
+
+        """
+        renamed_files = {}
+        change_set = []
+        rows = []
+        filepaths = []
+        authors = []
+
+        for commit_hash in self.get_commits(from_commit, to_commit):
+            author, start, stop = self.commits[commit_hash]
+            change_set.append(stop - start)
+
+            # From the newest commit, to map the old paths of renamed files to the newest one
+            for i in range(start, stop):
+                filepath = renamed_files.get(self.new_paths[i], self.new_paths[i])
+
+                if self.renamed_files[i]:
+                    renamed_files[self.old_paths[i]] = filepath
+
+                rows.append(i)
+                filepaths.append(filepath)
+                authors.append(author)
+
+        metrics = {
+            'dict_change_set_max': max(change_set, default=0),
+            'dict_change_set_avg': round(statistics.mean(change_set)) if change_set else 0
+        }
+
+        facts = pd.DataFrame({
+            'filepath': pd.Series(filepaths, dtype=object),
+            'author': pd.Series(authors, dtype=object),
+            'added_file': pd.Series([self.added_files[i] for i in rows], dtype=bool),
+            'additions': pd.Series([self.additions[i] for i in rows], dtype='int64'),
+            'deletions': pd.Series([self.deletions[i] for i in rows], dtype='int64'),
+            'hunks': pd.Series([self.hunks[i] for i in rows], dtype='int64')
+        })
+
+        files = facts.groupby('filepath')
+
+        # Code churn, ignoring the commits adding the file
+        churns = (facts.additions - facts.deletions)[~facts.added_file].groupby(facts.filepath[~facts.added_file])
+        metrics['dict_code_churn_count'] = _to_dict(churns.sum())
+        metrics['dict_code_churn_max'] = _to_dict(churns.max())
+        metrics['dict_code_churn_avg'] = _to_dict(churns.mean().round().astype('int64'))
+
+        sizes = files.size()
+        metrics['dict_commits_count'] = _to_dict(sizes)
+
+        # Lines authored by each contributor, for the files with at least one line authored
+        lines_authored = (facts.additions + facts.deletions).groupby([facts.filepath, facts.author]).sum()
+        total = lines_authored.groupby(level=0).transform('sum')
+        lines_authored, total = lines_authored[total != 0], total[total != 0]
+        contributors = lines_authored.groupby(level=0)
+
+        metrics['dict_contributors_count'] = _to_dict(contributors.size())
+        metrics['dict_minor_contributors_count'] = _to_dict((lines_authored / total < .05).groupby(level=0).sum())
+        highest = contributors.max()
+        metrics['dict_highest_contributor_experience'] = {
+            filepath: round(100 * lines / lines_total, 2)
+            for filepath, lines, lines_total in zip(highest.index.tolist(), highest.tolist(),
+                                                    contributors.sum().tolist())
+        }
+
+        # As statistics.median: the middle value for an odd number of values, the mean of the middle two otherwise
+        medians = files.hunks.median()
+        metrics['dict_hunks_median'] = {
+            filepath: median if size % 2 == 0 else int(median)
+            for filepath, median, size in zip(medians.index.tolist(), medians.tolist(), sizes.tolist())
+        }
+
+        metrics['dict_additions'] = _to_dict(files.additions.sum())
+        metrics['dict_additions_max'] = _to_dict(files.additions.max())
+        metrics['dict_additions_avg'] = _to_dict(files.additions.mean().round().astype('int64'))
+        metrics['dict_deletions'] = _to_dict(files.deletions.sum())
+        metrics['dict_deletions_max'] = _to_dict(files.deletions.max())
+        metrics['dict_deletions_avg'] = _to_dict(files.deletions.mean().round().astype('int64'))
+
+        return metrics
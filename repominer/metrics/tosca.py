@@ -1,4 +1,7 @@
+from typing import Union
+
 from .base import BaseMetricsExtractor
+from repominer.files import LazyContent
 from repominer.filters import is_tosca_file
 from toscametrics.import_metrics import general_metrics, blueprint_metrics
 
@@ -24,6 +27,9 @@ METRICS_TO_COMPUTE = (
 
 class ToscaMetricsExtractor(BaseMetricsExtractor):
 
+    METRICS_LIBRARY = 'tosca-metrics'
+    PRODUCT_METRICS = {name: float if name in ('text_entropy',) else int for name in METRICS_TO_COMPUTE}
+
     def __init__(self, path_to_repo: str, clone_repo_to: str = None, at: str = 'release'):
         super().__init__(path_to_repo, clone_repo_to, at)
 
@@ -59,5 +65,5 @@ class ToscaMetricsExtractor(BaseMetricsExtractor):
 
         return results
 
-    def ignore_file(self, path_to_file: str, content: str = None):
+    def ignore_file(self, path_to_file: str, content: Union[str, LazyContent] = None):
         return not is_tosca_file(path_to_file, content)
@@ -1,14 +1,19 @@
+import hashlib
+import inspect
 import yaml
 
-from typing import List
+from typing import List, Union
 
 from pydriller.repository import Repository
-from pydriller.domain.commit import ModificationType
+from pydriller.domain.commit import ModificationType, ModifiedFile
 
 from repominer import filters, utils
+from repominer.files import LazyContent
+from repominer.mining import ansible_modules
 from repominer.mining.ansible_modules import DATABASE_MODULES, FILE_MODULES, IDENTITY_MODULES, NETWORK_MODULES, \
     STORAGE_MODULES
 from repominer.mining.base import BaseMiner, FixingCommitClassifier
+from repominer.mining.commits import ModifiedFileSnapshot
 
 CONFIG_DATA_MODULES = DATABASE_MODULES + FILE_MODULES + IDENTITY_MODULES + NETWORK_MODULES + STORAGE_MODULES
 
@@ -21,7 +26,7 @@ class AnsibleMiner(BaseMiner):
         super(self.__class__, self).__init__(url_to_repo, clone_repo_to, branch)
         self.FixingCommitClassifier = AnsibleFixingCommitClassifier
 
-    def ignore_file(self, path_to_file: str, content: str = None):
+    def ignore_file(self, path_to_file: str, content: Union[str, LazyContent] = None):
         """
         Ignore non-Ansible files.
 
@@ -30,8 +35,8 @@ class AnsibleMiner(BaseMiner):
         path_to_file: str
             The filepath (e.g., repominer/mining/base.py).
 
-        content: str
-            The file content.
+        content: Union[str, LazyContent]
+            The file content, or a LazyContent loading it on first call.
 
         Returns
         -------
@@ -46,6 +51,22 @@ class AnsibleFixingCommitClassifier(FixingCommitClassifier):
     """ This class extends a FixingCommitClassifier to classify bug-fixing commits of Ansible files.
     """
 
+    @classmethod
+    def fingerprint(cls) -> str:
+        # The data checks also depend on the list of Ansible modules
+        return hashlib.sha1((super().fingerprint() + inspect.getsource(ansible_modules)).encode()).hexdigest()
+
+    @classmethod
+    def snapshot_modified_file(cls, modified_file: ModifiedFile) -> ModifiedFileSnapshot:
+        snapshot = super().snapshot_modified_file(modified_file)
+
+        # The source code is only needed to compare data, includes, and services of Ansible files
+        if filters.is_ansible_file(modified_file.new_path):
+            snapshot.source_code = modified_file.source_code
+            snapshot.source_code_before = modified_file.source_code_before
+
+        return snapshot
+
     def is_data_changed(self) -> bool:
         for modified_file in self.commit.modified_files:
             if modified_file.change_type != ModificationType.MODIFY or not filters.is_ansible_file(
@@ -1,30 +1,59 @@
+import bisect
+import collections
+import concurrent.futures
+import functools
+import hashlib
+import inspect
+import itertools
+import json
 import os
-import nltk
 import re
+import threading
 
-from typing import Dict, Generator, List
+from typing import Callable, Dict, Generator, Iterable, List, Set, Tuple, Union
 
-from pydriller.domain.commit import Commit, ModificationType
+from git import GitCommandError, Repo
+from pydriller.domain.commit import Commit, ModificationType, ModifiedFile
 from pydriller.repository import Git, Repository
 
 from repominer import utils
-from repominer.files import FixedFile, FailureProneFile
+from repominer.cache import BlameCache, ClassificationCache
+from repominer.files import FixedFile, FixedFileEncoder, FailureProneFile, LazyContent
 from repominer.mining import rules
-
-# Important: downloading resources for NLTK
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+from repominer.mining.commits import CommitIndex, CommitSnapshot, ModifiedFileSnapshot
 
 # Constants
 full_name_pattern = re.compile(r'(github|gitlab){1}\.com/([\w\W]+)$')
 
+# Options of the git blame run by PyDriller's SZZ, part of the key of cached blames
+BLAME_OPTIONS = '-w'
+
+# Header of a blamed line in the porcelain format of git blame: <sha> <original line> <final line> [<lines>]
+blame_header_pattern = re.compile(r'^([0-9a-f]{40}) \d+ \d+', re.MULTILINE)
+
+
+def _classify_chunk(classifier: type, commits: list, batch_size: int) -> Tuple[List[List[str]], collections.Counter]:
+    """ Classify a chunk of commits in a worker process, and return their fixing categories and the tiers counters """
+    stats = collections.Counter()
+    return classifier.classify_many(commits, batch_size=batch_size, stats=stats), stats
+
+
+def _line_ranges(lines: List[int]) -> Generator[Tuple[int, int], None, None]:
+    """ Group sorted line numbers into ranges of consecutive lines, as (start, end) """
+    for _, group in itertools.groupby(enumerate(lines), key=lambda item: item[1] - item[0]):
+        group = list(group)
+        yield group[0][1], group[-1][1]
+
+
+def _chunks(iterable: Iterable, size: int) -> Generator[list, None, None]:
+    """ Split an iterable into lists of at most ``size`` items """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
 
 class BaseMiner:
     """
@@ -65,6 +94,11 @@ class BaseMiner:
         branch : str
             Repository's branch to analyze.
 
+        commit_index : CommitIndex
+            Index of the commits on the repository's branch, mapping each commit hash to its chronological position.
+            It is built on first use (or restored by ``load_state``), and used to look up and sort commits without
+            scanning the history.
+
         commit_hashes : List[str]
             List of commit hash on the repository's branch, ordered by creation date.
 
@@ -88,7 +122,24 @@ class BaseMiner:
                 miner.fixing_commits = ['f350e05696db1c5f78320483e0e44e7aea410449']
 
             This is useful when you have to run the miner again on future commits, and you already have results from the
-            past runs.
+            past runs. See also ``save_state`` and ``load_state``, which do it for you.
+
+        fixing_commits_labels : Dict[str, List[str]]
+            The fixing categories of the bug-fixing commits found by ``get_fixing_commits``, over all its calls.
+
+        last_mined_commit : str
+            The head of the branch mined by a previous run, restored by ``load_state``. If set, ``get_fixing_commits``
+            only classifies the commits added after it.
+
+        classification_stats : collections.Counter
+            Counters of the last ``get_fixing_commits`` call: the number of classified commits (``commits``), the
+            number of commits discarded by each tier of the FixingCommitClassifier (``prefilter``, ``message``,
+            ``diff``), the number of fixing-commits found before discarding undesired ones (``fixing``), and the
+            number of commits whose categories were taken from the cache (``cached``).
+
+        content_stats : collections.Counter
+            Counters of the file contents passed to ``ignore_file``: the number of contents read (``loaded``), and
+            the number of blob reads avoided because ``ignore_file`` did not need the content (``avoided``).
 
         fixed_files : List[FixedFile]
             List of FixedFiles objects.
@@ -97,7 +148,8 @@ class BaseMiner:
             They are identified by the method ``get_fixed_files``.
             Unlike ``fixing_commits``, it cannot be used to inlude fixed file, as it resets at every ``get_fixed_files``
             call.
-            This is due to the algorithm used to identify them.
+            This is due to the algorithm used to identify them. However, the outcome of SZZ on each commit is kept
+            (and saved by ``save_state``), so that following calls only blame new fixing-commits.
 
         """
 
@@ -114,19 +166,139 @@ class BaseMiner:
         self.branch = branch
 
         self.fixing_commits = list()
+        self.fixing_commits_labels = dict()
+        self.last_mined_commit = None
+        self._mined_commit = None  # The head of the branch when get_fixing_commits was last called
         self.fixed_files = list()
+        self.classification_stats = collections.Counter()
+        self.content_stats = collections.Counter()
 
-        # Get all the repository commits sorted by commit date
-        self.commit_hashes = [c.hash for c in
-                              Repository(
-                                  path_to_repo=self.path_to_repo if os.path.isdir(self.path_to_repo) else url_to_repo,
-                                  clone_repo_to=clone_repo_to,
-                                  only_in_branch=self.branch,
-                                  order='date-order',
-                                  num_workers=1).traverse_commits()]
+        # Outcome of SZZ on the commits traversed by get_fixed_files, and commits whose files have been blamed
+        self._szz_events = dict()
+        self._szz_blamed = set()
+
+        if not os.path.isdir(self.path_to_repo):
+            Repo.clone_from(url=url_to_repo, to_path=self.path_to_repo)
+
+        self._commit_index = None
 
         self.FixingCommitClassifier = FixingCommitClassifier
 
+    @property
+    def commit_index(self) -> CommitIndex:
+        if self._commit_index is None:
+            # Get all the repository commits sorted by commit date
+            self._commit_index = CommitIndex(c.hash for c in Repository(path_to_repo=self.path_to_repo,
+                                                                         only_in_branch=self.branch,
+                                                                         order='date-order',
+                                                                         num_workers=1).traverse_commits())
+
+        return self._commit_index
+
+    @commit_index.setter
+    def commit_index(self, index: CommitIndex) -> None:
+        self._commit_index = index
+
+    @property
+    def commit_hashes(self) -> List[str]:
+        return self.commit_index.hashes
+
+    @commit_hashes.setter
+    def commit_hashes(self, hashes: List[str]) -> None:
+        self.commit_index = CommitIndex(hashes)
+
+    def save_state(self, path_to_state: str) -> None:
+        """
+        Save the mining state to a JSON file, to resume the mining later with ``load_state``.
+
+        The state includes the commit index, the last mined commit, the fixing-commits and their categories,
+        the fixed-files, and the outcome of SZZ on the commits traversed so far.
+
+        Parameters
+        ----------
+        path_to_state : str
+            The path to the JSON file.
+
+        """
+        state = {
+            'miner': self.__class__.__name__,
+            'branch': self.branch,
+            'last_mined_commit': self._mined_commit or self.last_mined_commit,
+            'commit_hashes': self.commit_hashes,
+            'fixing_commits': self.fixing_commits,
+            'fixing_commits_labels': self.fixing_commits_labels,
+            'fixed_files': self.fixed_files,
+            'szz_events': self._szz_events,
+            'szz_blamed': sorted(self._szz_blamed)
+        }
+
+        with open(path_to_state, 'w') as f:
+            json.dump(state, f, cls=FixedFileEncoder)
+
+    def load_state(self, path_to_state: str) -> None:
+        """
+        Load a mining state saved by ``save_state``, to mine only the commits added since then.
+
+        The commit index is extended with the commits added to the branch after the last mined commit, instead of
+        traversing the whole history. Then, ``get_fixing_commits`` only classifies the new commits, and
+        ``get_fixed_files`` only blames the new fixing-commits.
+
+        Example
+        -------
+        .. highlight:: python
+        .. code-block:: python
+
+            miner = AnsibleMiner('https://github.com/radon-h2020/radon-repository-miner', '/tmp')
+
+            if os.path.isfile('state.json'):
+                miner.load_state('state.json')
+
+            miner.get_fixing_commits()
+            miner.get_fixed_files()
+            miner.save_state('state.json')
+
+        Parameters
+        ----------
+        path_to_state : str
+            The path to the JSON file.
+
+        Raises
+        ------
+        ValueError
+            If the state was saved by another miner or for another branch, or if the last mined commit is no longer
+            in the branch (e.g., after a force-push).
+
+        """
+        with open(path_to_state) as f:
+            state = json.load(f)
+
+        if state['miner'] != self.__class__.__name__ or state['branch'] != self.branch:
+            raise ValueError(f'The state in {path_to_state} was saved by a {state["miner"]} for branch '
+                             f'{state["branch"]}.')
+
+        commit_hashes = state['commit_hashes']
+        last_mined_commit = state['last_mined_commit']
+
+        if last_mined_commit:
+            git_repo = Git(self.path_to_repo)
+            head = git_repo.repo.commit(self.branch or 'HEAD').hexsha
+
+            if not git_repo.repo.is_ancestor(last_mined_commit, head):
+                raise ValueError(f'{last_mined_commit} is no longer in the branch. Mine the repository from scratch.')
+
+            # The new commits are appended in date order. They cannot be ancestors of the old ones.
+            commit_hashes.extend(commit.hash for commit in git_repo.get_list_commits(f'{last_mined_commit}..{head}',
+                                                                                     date_order=True))
+
+        self.commit_hashes = commit_hashes
+        self.last_mined_commit = last_mined_commit
+        self.fixing_commits = state['fixing_commits']
+        self.fixing_commits_labels = state['fixing_commits_labels']
+        self.fixed_files = [FixedFile(filepath=file['filepath'], fic=file['fic'], bic=file['bic'])
+                            for file in state['fixed_files']]
+        self._szz_events = state['szz_events']
+        self._szz_blamed = set(state['szz_blamed'])
+
     def discard_undesired_fixing_commits(self, commits: List[str]) -> None:
         """
         Discard undesired commits.
@@ -149,37 +321,65 @@ class BaseMiner:
 
         self.sort_commits(commits)
 
-        for commit in Repository(self.path_to_repo,
-                                 from_commit=commits[0],  # first commit in commits
-                                 to_commit=commits[-1],  # last commit in commits
-                                 only_in_branch=self.branch).traverse_commits():
-            i = 0
-
-            # if none of the modified files is a Ansible file then discard the commit
-            while i < len(commit.modified_files):
-                if commit.modified_files[i].change_type != ModificationType.MODIFY:
-                    i += 1
-                elif self.ignore_file(commit.modified_files[i].new_path, commit.modified_files[i].source_code):
-                    i += 1
-                else:
-                    break
+        git_repo = Git(self.path_to_repo)
+        undesired = set()
 
-            if i == len(commit.modified_files) and commit.hash in commits:
-                commits.remove(commit.hash)
+        # Only the candidate commits are fetched, rather than traversing the history between the first and the last
+        for sha in commits:
+            # Each access to modified_files computes the diff again
+            modified_files = git_repo.get_commit(sha).modified_files
 
-    def get_fixing_commits(self, num_workers=8) -> Dict[str, List[str]]:
+            # if none of the modified files is a Ansible file then discard the commit
+            if not any(modified_file.change_type == ModificationType.MODIFY
+                       and not self._ignore_modified_file(modified_file)
+                       for modified_file in modified_files):
+                undesired.add(sha)
+
+        if undesired:
+            commits[:] = [sha for sha in commits if sha not in undesired]
+
+    def get_fixing_commits(self,
+                           num_workers: int = 8,
+                           chunk_size: int = None,
+                           batch_size: int = 1000,
+                           n_process: int = 1,
+                           num_processes: int = 1,
+                           cache: ClassificationCache = None) -> Dict[str, List[str]]:
         """
         Return a list of bug-fixing commit hash, categorized as fixing "conditionals", "configuration data",
         "dependencies", "documentation", "idempotency", "security", "service", "syntax".
 
         This method returns the commits whose message indicates defective scripts.
-        `Note:` Beside returning the list of bug-fixing commits, it also updates the attribute ``fixing_commits``.
+        `Note:` Beside returning the list of bug-fixing commits, it also updates the attributes ``fixing_commits`` and
+        ``fixing_commits_labels``. If a state was loaded, only the commits added since ``last_mined_commit`` are
+        classified.
 
         Parameters
         ----------
         num_workers : int
             Number of threads. Default 8.
 
+        chunk_size : int
+            If set, commits are classified in chunks of ``chunk_size`` commits, whose messages are parsed in batch by
+            spaCy (see ``FixingCommitClassifier.classify_many``). Otherwise, commits are classified one at a time.
+            Default None.
+
+        batch_size : int
+            The number of sentences buffered by spaCy for each batch, when ``chunk_size`` is set. Default 1000.
+
+        n_process : int
+            The number of processes used by spaCy to parse the sentences, when ``chunk_size`` is set. Default 1.
+
+        num_processes : int
+            Number of worker processes classifying the commits. Default 1.
+            If greater than 1, chunks of ``chunk_size`` commits (default 100) are sent as ``CommitSnapshot`` to a pool
+            of processes, each holding its own spaCy model. The results are the same as with a single process.
+
+        cache : ClassificationCache
+            If given, the categories of commits already classified by the same classifier (see
+            ``FixingCommitClassifier.fingerprint``) are taken from the cache, and those of the other commits are
+            stored in it. Default None.
+
         Returns
         -------
         List[str]
@@ -189,33 +389,45 @@ class BaseMiner:
 
         commits_labels = {}
         commits = []
+        known_fixing_commits = set(self.fixing_commits)
+        self.classification_stats = collections.Counter()
 
-        for commit in Repository(self.path_to_repo, only_in_branch=self.branch, num_workers=num_workers).traverse_commits():
+        cached_labels = {}
+        if cache is not None:
+            fingerprint = self.FixingCommitClassifier.fingerprint()
+            cached_labels = cache.load(fingerprint)
 
-            if commit.hash in self.fixing_commits:
-                continue
+        git_repo = Git(self.path_to_repo)
+        head = git_repo.repo.commit(self.branch or 'HEAD').hexsha
+
+        if self.last_mined_commit:
+            # Only the commits added since the last run, from the oldest
+            new_commits = git_repo.get_list_commits(f'{self.last_mined_commit}..{head}')
+        else:
+            new_commits = Repository(self.path_to_repo,
+                                     to_commit=head,
+                                     num_workers=num_workers).traverse_commits()
+
+        to_classify = self._prefilter(commit for commit in new_commits if commit.hash not in known_fixing_commits)
+
+        if num_processes > 1:
+            classified = self._classify_in_pool(to_classify, cached_labels, num_processes, chunk_size or 100,
+                                                batch_size)
+        else:
+            classified = self._classify(to_classify, cached_labels, chunk_size, batch_size, n_process)
+
+        new_labels = {}
+
+        for sha, labels in classified:
+            if sha not in cached_labels:
+                new_labels[sha] = labels
 
-            fcc = self.FixingCommitClassifier(commit)
-
-            if fcc.fixes_conditional():
-                commits_labels.setdefault(commit.hash, []).append('CONDITIONAL')
-            if fcc.fixes_configuration_data():
-                commits_labels.setdefault(commit.hash, []).append('CONFIGURATION_DATA')
-            if fcc.fixes_dependency():
-                commits_labels.setdefault(commit.hash, []).append('DEPENDENCY')
-            if fcc.fixes_documentation():
-                commits_labels.setdefault(commit.hash, []).append('DOCUMENTATION')
-            if fcc.fixes_idempotency():
-                commits_labels.setdefault(commit.hash, []).append('IDEMPOTENCY')
-            if fcc.fixes_security():
-                commits_labels.setdefault(commit.hash, []).append('SECURITY')
-            if fcc.fixes_service():
-                commits_labels.setdefault(commit.hash, []).append('SERVICE')
-            if fcc.fixes_syntax():
-                commits_labels.setdefault(commit.hash, []).append('SYNTAX')
-
-            if commit.hash in commits_labels:
-                commits.append(commit.hash)
+            if labels:
+                commits_labels[sha] = labels
+                commits.append(sha)
+
+        if cache is not None and new_labels:
+            cache.update(new_labels, fingerprint)
 
         if commits:
             # Discard commits that do not touch IaC files
@@ -227,13 +439,118 @@ class BaseMiner:
             # Sort fixing_commits in ascending order of date
             self.sort_commits(self.fixing_commits)
 
+            desired = set(commits)
             for sha in list(commits_labels.keys()):
-                if sha not in commits:  # It means it was an undesired commit
+                if sha not in desired:  # It means it was an undesired commit
                     del commits_labels[sha]
 
+        self.fixing_commits_labels.update(commits_labels)
+        self._mined_commit = head
+
         return commits_labels
 
-    def get_fixed_files(self) -> None:
+    def _prefilter(self, commits: Iterable[Commit]) -> Generator[Commit, None, None]:
+        """
+        Yield the commits passing the FixingCommitClassifier's prefilter, and count the discarded ones.
+        """
+        for commit in commits:
+            if self.FixingCommitClassifier.prefilter(commit.msg):
+                yield commit
+            else:
+                self.classification_stats['commits'] += 1
+                self.classification_stats['prefilter'] += 1
+
+    def _classify(self,
+                  commits: Iterable[Commit],
+                  cached_labels: Dict[str, List[str]],
+                  chunk_size: int = None,
+                  batch_size: int = 1000,
+                  n_process: int = 1) -> Generator[Tuple[str, List[str]], None, None]:
+        """
+        Classify commits in the current process, and yield their hash and fixing categories in the same order.
+        Categories in ``cached_labels`` are used instead of classifying the commit again.
+        """
+        for chunk in _chunks(commits, chunk_size or 1):
+            to_classify = [commit for commit in chunk if commit.hash not in cached_labels]
+
+            if not to_classify:
+                chunk_labels = []
+            elif chunk_size:
+                chunk_labels = self.FixingCommitClassifier.classify_many(to_classify, batch_size, n_process,
+                                                                         stats=self.classification_stats)
+            else:
+                fcc = self.FixingCommitClassifier(to_classify[0])
+                chunk_labels = [fcc.classify()]
+                self.classification_stats['commits'] += 1
+                self.classification_stats[fcc.discarded_by or 'fixing'] += 1
+
+            yield from self._merge([commit.hash for commit in chunk], chunk_labels, cached_labels)
+
+    def _classify_in_pool(self,
+                          commits: Iterable[Commit],
+                          cached_labels: Dict[str, List[str]],
+                          num_processes: int,
+                          chunk_size: int,
+                          batch_size: int = 1000) -> Generator[Tuple[str, List[str]], None, None]:
+        """
+        Classify commits in a pool of processes, and yield their hash and fixing categories in the same order.
+        Categories in ``cached_labels`` are used instead of classifying the commit again.
+
+        Each chunk of commits is converted to snapshots in the current process, as PyDriller's commits cannot be sent
+        to other processes. At most two chunks per process are pending at any time, to bound the memory.
+        """
+        classifier = self.FixingCommitClassifier
+        pending = collections.deque()
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=num_processes, initializer=utils.warmup) as executor:
+
+            for chunk in _chunks(commits, chunk_size):
+                snapshots = [classifier.snapshot(commit) for commit in chunk if commit.hash not in cached_labels]
+                pending.append((
+                    [commit.hash for commit in chunk],
+                    executor.submit(_classify_chunk, classifier, snapshots, batch_size) if snapshots else None
+                ))
+
+                while len(pending) >= 2 * num_processes:
+                    yield from self._collect(*pending.popleft(), cached_labels)
+
+            while pending:
+                yield from self._collect(*pending.popleft(), cached_labels)
+
+    def _collect(self,
+                 hashes: List[str],
+                 future: Union[concurrent.futures.Future, None],
+                 cached_labels: Dict[str, List[str]]) -> Generator[Tuple[str, List[str]], None, None]:
+        """
+        Wait for a chunk classified by a worker process, and yield the hash and fixing categories of its commits.
+        """
+        chunk_labels = []
+
+        if future is not None:
+            chunk_labels, stats = future.result()
+            self.classification_stats.update(stats)
+
+        yield from self._merge(hashes, chunk_labels, cached_labels)
+
+    def _merge(self,
+               hashes: List[str],
+               labels: List[List[str]],
+               cached_labels: Dict[str, List[str]]) -> Generator[Tuple[str, List[str]], None, None]:
+        """
+        Yield the hash and fixing categories of a chunk of commits, in order. The categories are taken from
+        ``cached_labels`` if the commit is cached, or from ``labels`` otherwise.
+        """
+        labels = iter(labels)
+
+        for sha in hashes:
+            if sha in cached_labels:
+                self.classification_stats['commits'] += 1
+                self.classification_stats['cached'] += 1
+                yield sha, cached_labels[sha]
+            else:
+                yield sha, next(labels)
+
+    def get_fixed_files(self, cache: BlameCache = None, num_workers: int = 8) -> None:
         """
         Populate the list of FixedFile objects.
 
@@ -242,10 +559,20 @@ class BaseMiner:
 
         It uses the SZZ algorithm implemented in PyDriller to identify the oldest commit that introduced the bug,
         referred to as bug-introducing commit.
+        The history is traversed once to track renamings and collect the files to blame, while the blames run in a pool
+        of threads. Then, the fixed files are merged in the order of the traversal, so the outcome does not depend
+        on ``num_workers``.
 
         `Note:` before calling this method, it is necessary that you run at least one between
         `get_fixing_commits_from_closed_issues` and `get_fixing_commits_from_commit_messages`.
 
+        Parameters
+        ----------
+        cache : BlameCache
+            If given, blames are taken from the cache when possible, and stored in it otherwise. Default None.
+
+        num_workers : int
+            Number of threads running git blame. Default 8.
 
         Returns
         -------
@@ -258,9 +585,7 @@ class BaseMiner:
 
         self.sort_commits(self.fixing_commits)
 
-        self.fixed_files = list()
-        renamed_files = dict()
-        git_repo = Git(self.path_to_repo)
+        fixing_commits = set(self.fixing_commits)
 
         if len(self.fixing_commits) == 1:
             repository_mining = Repository(self.path_to_repo, single=self.fixing_commits[0], only_in_branch=self.branch,
@@ -273,68 +598,193 @@ class BaseMiner:
                                            only_in_branch=self.branch,
                                            num_workers=1)
 
-        # Traverse commits from the latest to the first fixing-commit
-        for commit in repository_mining.traverse_commits():
+        events = []
+        blamers = []  # One Git object per thread, as GitPython's object database is not thread-safe
+        local = threading.local()
+        lock = threading.Lock()  # Opening a Git object writes the repository's config
 
-            for modified_file in commit.modified_files:
+        def blame(commit: Commit, modified_file: ModifiedFile) -> Set[str]:
+            if not hasattr(local, 'git_repo'):
+                with lock:
+                    local.git_repo = Git(self.path_to_repo)
+                    blamers.append(local.git_repo)
+
+            return self._get_bug_inducing_commits(commit, modified_file, local.git_repo)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+
+            # Traverse commits from the latest to the first fixing-commit.
+            # Commits already traversed by a previous call are not analyzed again, unless they became fixing-commits.
+            for commit in repository_mining.traverse_commits():
+                is_fixing = commit.hash in fixing_commits
+
+                if commit.hash not in self._szz_events or (is_fixing and commit.hash not in self._szz_blamed):
+                    submit = functools.partial(executor.submit, blame, commit)
+                    self._szz_events[commit.hash] = self._get_szz_events(commit, is_fixing, submit, cache)
+
+                    if is_fixing:
+                        self._szz_blamed.add(commit.hash)
+
+                events.append((commit.hash, self._szz_events[commit.hash]))
+
+            # Wait for the blames, in the order of the traversal
+            for sha, commit_events in events:
+                commit_events[:] = self._resolve_szz_events(sha, commit_events, cache)
+
+        for git_repo in blamers:
+            git_repo.clear()
+
+        self._merge_szz_events(events, fixing_commits)
+
+    def _get_szz_events(self,
+                        commit: Commit,
+                        blame: bool,
+                        submit: Callable[[ModifiedFile], concurrent.futures.Future],
+                        cache: BlameCache = None) -> List[Tuple[str, str, object]]:
+        """
+        Return the renamings in a commit, as ('rename', old_path, new_path), and if ``blame`` is True, the files to
+        blame, as ('blame', new_path, bug-inducing commits), where the bug-inducing commits are either cached or the
+        future returned by ``submit``. Events follow the order of modified files.
+        """
+        events = []
+
+        for modified_file in commit.modified_files:
+
+            # Not interested in ADDED and DELETED files
+            if modified_file.change_type not in (ModificationType.MODIFY, ModificationType.RENAME):
+                continue
+
+            # If RENAMED then handle renaming
+            if modified_file.change_type == ModificationType.RENAME:
+                events.append(('rename', modified_file.old_path, modified_file.new_path))
+
+            # This is to ensure that renamed files are tracked. Then, if the commit is not a fixing-commit then
+            # go to the next (previous commit in chronological order)
+            if not blame:
+                continue
+
+            # Not interested in type of files
+            if self._ignore_modified_file(modified_file):
+                continue
 
-                # Not interested in ADDED and DELETED files
-                if modified_file.change_type not in (ModificationType.MODIFY, ModificationType.RENAME):
+            # Identify bug-inducing commits
+            bug_inducing_commits = None
+
+            if cache is not None:
+                bug_inducing_commits = cache.get(commit.hash, modified_file.new_path, BLAME_OPTIONS)
+
+            if bug_inducing_commits is None:
+                bug_inducing_commits = submit(modified_file)
+
+            events.append(('blame', modified_file.new_path, bug_inducing_commits))
+
+        return events
+
+    def _resolve_szz_events(self,
+                            sha: str,
+                            events: list,
+                            cache: BlameCache = None) -> List[Tuple[str, str, str]]:
+        """
+        Wait for the blames of a commit, and replace each file to blame with its oldest bug-inducing commit, as
+        ('fix', new_path, bic). Files without bug-inducing commits are discarded. New blames are stored in the cache.
+        """
+        resolved = []
+
+        for event_type, path, other in events:
+
+            if event_type == 'blame':
+                if isinstance(other, concurrent.futures.Future):
+                    other = other.result()
+
+                    if cache is not None:
+                        cache.put(sha, path, BLAME_OPTIONS, other)
+
+                if not other:
                     continue
 
-                # If RENAMED then handle renaming
-                if modified_file.change_type == ModificationType.RENAME:
+                event_type, other = 'fix', self.commit_index.sorted(other)[0]  # The oldest bug-inducing-commit
+
+            resolved.append((event_type, path, other))
+
+        return resolved
+
+    @staticmethod
+    def _get_bug_inducing_commits(commit: Commit, modified_file: ModifiedFile, git_repo: Git) -> Set[str]:
+        """
+        Return the commits that last modified the lines deleted or modified in a file.
+
+        It is equivalent to PyDriller's ``get_commits_last_modified_lines``, but only the deleted lines are blamed
+        (``git blame -L``), instead of the whole file. Deleted lines that are blank or comments are not blamed.
+        """
+        path = modified_file.new_path
+        if modified_file.change_type == ModificationType.RENAME:
+            path = modified_file.old_path  # The file is blamed in the parent commit
+
+        lines = sorted({num_line for num_line, line in modified_file.diff_parsed['deleted']
+                        if not Git._useless_line(line.strip())})
+
+        if not lines:
+            return set()
+
+        args = [BLAME_OPTIONS, '--porcelain']
+        for start, end in _line_ranges(lines):
+            args.extend(('-L', f'{start},{end}'))
+
+        try:
+            blame = git_repo.repo.git.blame(*args, commit.hash + '^', '--', path)
+        except GitCommandError:
+            return set()  # E.g., the file was renamed twice
+
+        return {match.group(1) for match in blame_header_pattern.finditer(blame)}
+
+    def _merge_szz_events(self, events: List[Tuple[str, list]], fixing_commits: set) -> None:
+        """
+        Rebuild ``fixed_files`` from the SZZ events of the traversed commits, from the latest to the first.
+        """
+        self.fixed_files = list()
+        fixed_files_by_path = collections.defaultdict(list)  # The FixedFiles of each path, in order of insertion
+        renamed_files = dict()
+        position = self.commit_index.position
+
+        for sha, commit_events in events:
+            for event_type, path, other in commit_events:
+
+                if event_type == 'rename':
                     # if modified_file.new_path in renamed_files:
                     #     renamed_files[modified_file.old_path] = renamed_files[modified_file.new_path]
                     # else:
-                    renamed_files[modified_file.old_path] = renamed_files.get(modified_file.new_path,
-                                                                              modified_file.new_path)
-                    # elif commit.hash in self.fixing_commits:
-                    #     renamed_files[modified_file.old_path] = modified_file.new_path
-
-                # This is to ensure that renamed files are tracked. Then, if the commit is not a fixing-commit then
-                # go to the next (previous commit in chronological order)
-                if commit.hash not in self.fixing_commits:
+                    renamed_files[path] = renamed_files.get(other, other)
                     continue
 
-                # Not interested in type of files
-                if self.ignore_file(modified_file.new_path, modified_file.source_code):
+                # Blamed when it was a fixing-commit, but it is no longer
+                if sha not in fixing_commits:
                     continue
 
-                # Identify bug-inducing commits. Dict[modified_file, Set[commit_hashes]]
-                bug_inducing_commits = git_repo.get_commits_last_modified_lines(commit, modified_file)
+                current_fix = FixedFile(filepath=renamed_files.get(path, path), bic=other, fic=sha)
+                chain = fixed_files_by_path.get(current_fix.filepath)
 
-                if not bug_inducing_commits.get(modified_file.new_path):
-                    continue
-                else:
-                    bug_inducing_commits = list(bug_inducing_commits[modified_file.new_path])
-                    self.sort_commits(bug_inducing_commits)
-                    bic = bug_inducing_commits[0]  # bic is the oldest bug-inducing-commit
-
-                current_fix = FixedFile(filepath=renamed_files.get(modified_file.new_path, modified_file.new_path),
-                                        bic=bic,
-                                        fic=commit.hash)
-
-                if current_fix not in self.fixed_files:
+                if not chain:
                     self.fixed_files.append(current_fix)
+                    fixed_files_by_path[current_fix.filepath].append(current_fix)
                 else:
-                    idx = self.fixed_files.index(current_fix)
-                    existing_fix = self.fixed_files[idx]
+                    # FixedFiles are equal if their filepath is, so the fix is always merged with the first of the path
+                    existing_fix = chain[0]
 
                     # If the current FIC is older than the existing bic, then save it as a new FixedFile.
                     # Else it means the current fix is between the existing fix bic and fic.
                     # If the current BIC is older than the existing bic, then update the bic.
-                    if self.commit_hashes.index(current_fix.fic) < self.commit_hashes.index(existing_fix.bic):
+                    if position(current_fix.fic) < position(existing_fix.bic):
 
-                        if modified_file.new_path in renamed_files:
-                            del renamed_files[modified_file.new_path]
+                        if path in renamed_files:
+                            del renamed_files[path]
 
-                        current_fix.filepath = modified_file.new_path
+                        current_fix.filepath = path
                         self.fixed_files.append(current_fix)
-                    elif self.commit_hashes.index(current_fix.bic) < self.commit_hashes.index(existing_fix.bic):
+                        fixed_files_by_path[current_fix.filepath].append(current_fix)
+                    elif position(current_fix.bic) < position(existing_fix.bic):
                         existing_fix.bic = current_fix.bic
 
-    def ignore_file(self, path_to_file: str, content: str = None) -> bool:
+    def ignore_file(self, path_to_file: str, content: Union[str, LazyContent] = None) -> bool:
         """
         Ignore a file.
 
@@ -344,13 +794,16 @@ class BaseMiner:
         filepath and content. That is, only files terminating with .yml, .yaml, or .tosca, or which content contains the
         keyword ``tosca_definitions_version`` are kept.
 
+        The miner passes the content as a LazyContent, which reads the file only when called. Hence, overriding methods
+        should call it only when the filepath is not enough to decide (see ``content_stats``).
+
         Parameters
         ----------
         path_to_file: str
             The filepath (e.g., repominer/mining/base.py).
 
-        content: str
-            The file content.
+        content: Union[str, LazyContent]
+            The file content, or a LazyContent loading it on first call.
 
         Returns
         -------
@@ -360,11 +813,25 @@ class BaseMiner:
         """
         return False
 
+    def _ignore_modified_file(self, modified_file: ModifiedFile) -> bool:
+        """
+        Call ``ignore_file`` on a modified file, with its content loaded lazily, and count whether it was loaded.
+        """
+        content = LazyContent(lambda: modified_file.source_code)
+        ignore = self.ignore_file(modified_file.new_path, content)
+        self.content_stats['loaded' if content.loaded else 'avoided'] += 1
+        return ignore
+
     def label(self) -> Generator[FailureProneFile, None, None]:
         """
         For each FixedFile object, yield a FailureProneFile object for each commit between the FixedFile's
         bug-introducing-commit and its fixing-commit.
 
+        The history is swept backward from the last fixing-commit, skipping the commits older than the oldest
+        bug-introducing-commit.
+        Each FixedFile is an interval [bic, fic) that becomes active when the sweep passes its fixing-commit, and
+        inactive when it passes its bug-introducing-commit. Hence, each commit only visits the FixedFiles that cover it.
+
         `Note:` make sure to run the method ``get_fixed_files`` before.
 
         Yields
@@ -377,28 +844,59 @@ class BaseMiner:
         if not (self.fixing_commits and self.fixed_files):
             return
 
-        labeling = dict()
-        for file in self.fixed_files:
-            labeling.setdefault(file.filepath, list()).append(file)
-
         self.sort_commits(self.fixing_commits)
 
+        position = self.commit_index.position
+
+        # Intervals [bic, fic) identified by the index of the FixedFile, to yield them in the same order as fixed_files
+        intervals = [(position(file.bic), position(file.fic), i) for i, file in enumerate(self.fixed_files)]
+        to_open = sorted(intervals, key=lambda interval: interval[1], reverse=True)
+        to_close = sorted(intervals, key=lambda interval: interval[0], reverse=True)
+        oldest_bic = to_close[-1][0]
+
+        active = []  # Sorted indices of the FixedFiles covering the current commit
+        next_to_open = next_to_close = 0
+        idx_previous = None
         renamed_files = {}
 
+        # Traverse down to the first commit, as PyDriller restricts the traversal to the ancestry path of to_commit,
+        # which would skip the commits of other branches merged after the oldest bug-introducing-commit
         for commit in Repository(self.path_to_repo, from_commit=self.fixing_commits[-1],
                                  to_commit=self.commit_hashes[0],
                                  order='reverse', num_workers=1).traverse_commits():
 
-            for file in self.fixed_files:
+            idx_commit = position(commit.hash)
 
-                idx_fic = self.commit_hashes.index(file.fic)
-                idx_bic = self.commit_hashes.index(file.bic)
-                idx_commit = self.commit_hashes.index(commit.hash)
+            if idx_commit < oldest_bic:
+                # Not covered by any interval. Do not stop, as later commits may be newer (e.g., because of clock skews)
+                continue
 
-                if idx_fic > idx_commit >= idx_bic:
-                    yield FailureProneFile(filepath=renamed_files.get(file.filepath, file.filepath),
-                                           commit=commit.hash,
-                                           fixing_commit=file.fic)
+            if idx_previous is not None and idx_commit > idx_previous:
+                # The traversal went forward in time (e.g., because of clock skews): rebuild the sweep state
+                active = sorted(i for idx_bic, idx_fic, i in intervals if idx_bic <= idx_commit < idx_fic)
+                next_to_open = sum(1 for _, idx_fic, _ in intervals if idx_fic > idx_commit)
+                next_to_close = sum(1 for idx_bic, _, _ in intervals if idx_bic > idx_commit)
+
+            idx_previous = idx_commit
+
+            while next_to_open < len(to_open) and to_open[next_to_open][1] > idx_commit:
+                idx_bic, _, i = to_open[next_to_open]
+                if idx_bic <= idx_commit:
+                    bisect.insort(active, i)
+                next_to_open += 1
+
+            while next_to_close < len(to_close) and to_close[next_to_close][0] > idx_commit:
+                i = to_close[next_to_close][2]
+                j = bisect.bisect_left(active, i)
+                if j < len(active) and active[j] == i:
+                    del active[j]
+                next_to_close += 1
+
+            for i in active:
+                file = self.fixed_files[i]
+                yield FailureProneFile(filepath=renamed_files.get(file.filepath, file.filepath),
+                                       commit=commit.hash,
+                                       fixing_commit=file.fic)
 
             # Handle file renaming
             for modified_file in commit.modified_files:
@@ -415,7 +913,7 @@ class BaseMiner:
             List of commits hash to sort.
 
         """
-        sorted_commits = [sha for sha in self.commit_hashes if sha in commits]
+        sorted_commits = self.commit_index.sorted(commits)
         commits.clear()
         commits.extend(sorted_commits)
 
@@ -424,15 +922,37 @@ class FixingCommitClassifier:
     """
     This class implements rules to detect fixing commits categories related to IaC defects, as defined in
     http://chrisparnin.me/pdf/GangOfEight.pdf.
+
+    Commits are classified in three tiers, from the cheapest to the most expensive:
+
+    1. ``prefilter``: the raw commit message must contain a defect pattern;
+    2. ``message``: the message is tokenized, and the sentences with a defect pattern are parsed to match the
+       categories on their head dependents;
+    3. ``diff``: the diff-based checks (e.g., ``is_comment_changed``) are run for the categories not matched yet.
     """
 
-    def __init__(self, commit: Commit):
+    # Fixing categories: (label, keyword categories, name of the diff-based check)
+    CATEGORIES = (
+        ('CONDITIONAL', rules.CONDITIONAL, None),
+        ('CONFIGURATION_DATA', rules.CONFIGURATION_DATA, 'is_data_changed'),
+        ('DEPENDENCY', rules.DEPENDENCY, 'is_include_changed'),
+        ('DOCUMENTATION', rules.DOCUMENTATION, 'is_comment_changed'),
+        ('IDEMPOTENCY', rules.IDEMPOTENCY, None),
+        ('SECURITY', rules.SECURITY, None),
+        ('SERVICE', rules.SERVICE, 'is_service_changed'),
+        ('SYNTAX', rules.SYNTAX, None)
+    )
+
+    # Tiers that can discard a commit
+    TIERS = ('prefilter', 'message', 'diff')
+
+    def __init__(self, commit: Union[Commit, CommitSnapshot]):
         """
         The class constructor.
 
         Parameters
         ----------
-        commit: Commit
+        commit: Union[Commit, CommitSnapshot]
             The commit to analyze.
 
         Raises
@@ -446,16 +966,296 @@ class FixingCommitClassifier:
             raise TypeError('Expected a pydriller.domain.commit.Commit object.')
 
         self.commit = commit
-        self.sentences = []  # will be list of tokens list
+        self.discarded_by = None  # The tier that discarded the commit, set by classify()
+        self._sentences = None
+
+        # Computed on first need, for each sentence
+        self._sentences_categories = dict()  # Keyword categories matched by the sentence
+        self._sentences_dep = dict()  # Head dependents
+        self._sentences_dep_categories = dict()  # Keyword categories matched by the head dependents
+
+    @classmethod
+    def fingerprint(cls) -> str:
+        """
+        Return a fingerprint of the classification logic, used to invalidate cached categories.
+
+        It is a digest of the source code of the rules, of the NLP utilities, and of the classifier class hierarchy,
+        and of the versions of spaCy and of its model, which parse the messages.
+        Subclasses depending on other modules should extend it.
+
+        Returns
+        -------
+        str
+            The hexadecimal digest.
+
+        """
+        sources = [inspect.getsource(rules), inspect.getsource(utils)]
+        sources.extend(inspect.getsource(klass) for klass in cls.__mro__ if issubclass(klass, FixingCommitClassifier))
+        sources.append(utils.get_nlp_version())
+        return hashlib.sha1('\n'.join(sources).encode()).hexdigest()
+
+    @staticmethod
+    def prefilter(msg: str) -> bool:
+        """
+        Return True if a commit message may indicate a fixing-commit, that is, if it contains a defect pattern.
+
+        Every sentence with a defect pattern contains it in one of its words, which are taken from the message.
+        Therefore, commits discarded by this check do not have any fixing category.
+
+        Parameters
+        ----------
+        msg : str
+            The commit message.
+
+        Returns
+        -------
+        bool
+            False if the commit is certainly not a fixing-commit. True, otherwise.
+
+        """
+        return bool(rules.match(msg) & rules.DEFECT)
+
+    @property
+    def sentences(self) -> List[List[str]]:
+        """
+        The alphabetic tokens of each sentence in the commit message.
+        The message is tokenized on first access.
+        """
+        if self._sentences is None:
+            self._sentences = []  # will be list of tokens list
+
+            nltk = utils.get_nltk()
+
+            for sentence in nltk.sent_tokenize(self.commit.msg):
+                # split into words
+                tokens = nltk.tokenize.word_tokenize(sentence)
+
+                # remove all tokens that are not alphabetic
+                tokens = [word.strip() for word in tokens if word.isalpha()]
+
+                self._sentences.append(tokens)
+
+        return self._sentences
+
+    def _get_sentence_categories(self, i: int) -> int:
+        """
+        Return the keyword categories matched by the i-th sentence (see ``rules.match``).
+        """
+        if i not in self._sentences_categories:
+            self._sentences_categories[i] = rules.match(' '.join(self.sentences[i]))
+
+        return self._sentences_categories[i]
+
+    def _get_sentence_dep(self, i: int) -> str:
+        """
+        Return the head dependents of the i-th sentence, joined by a whitespace.
+
+        The dependency parse is computed once per sentence, and shared by all the ``fixes_*`` methods.
+
+        Parameters
+        ----------
+        i : int
+            The index of the sentence in ``sentences``.
+
+        Returns
+        -------
+        str
+            The head dependents of the sentence.
+
+        """
+        if i not in self._sentences_dep:
+            self._sentences_dep[i] = ' '.join(utils.get_head_dependents(' '.join(self.sentences[i])))
+
+        return self._sentences_dep[i]
+
+    def _get_sentence_dep_categories(self, i: int) -> int:
+        """
+        Return the keyword categories matched by the head dependents of the i-th sentence (see ``rules.match``).
+        """
+        if i not in self._sentences_dep_categories:
+            self._sentences_dep_categories[i] = rules.match(self._get_sentence_dep(i))
+
+        return self._sentences_dep_categories[i]
+
+    def _fixes(self, categories: int, is_changed: Callable[[], bool] = None) -> bool:
+        """
+        Return True if a sentence with a defect pattern has head dependents matching any of the given categories,
+        or if such a sentence exists and ``is_changed()`` is True.
+
+        Parameters
+        ----------
+        categories : int
+            The bitwise OR of the categories to look for (e.g., ``rules.CONDITIONAL``).
+
+        is_changed : Callable[[], bool]
+            A diff-based check, e.g., ``is_comment_changed``.
+
+        Returns
+        -------
+        bool
+            True if the commit fixes the given categories. False, otherwise.
+
+        """
+        for i in range(len(self.sentences)):
+            if not self._get_sentence_categories(i) & rules.DEFECT:
+                continue
+
+            if self._get_sentence_dep_categories(i) & categories or (is_changed is not None and is_changed()):
+                return True
+
+        return False
+
+    def classify(self) -> List[str]:
+        """
+        Return the fixing categories of the commit.
+
+        The categories are "CONDITIONAL", "CONFIGURATION_DATA", "DEPENDENCY", "DOCUMENTATION", "IDEMPOTENCY",
+        "SECURITY", "SERVICE", and "SYNTAX". The result is the same as calling every ``fixes_*`` method, but the
+        commit goes through the tiers described in the class documentation, and each tier only runs if the
+        previous ones did not discard the commit. The discarding tier, if any, is stored in ``discarded_by``.
+
+        Returns
+        -------
+        List[str]
+            The fixing categories, in the order above. An empty list if the commit is not a fixing-commit.
+
+        """
+        self.discarded_by = None
 
-        for sentence in nltk.sent_tokenize(commit.msg):
-            # split into words
-            tokens = nltk.tokenize.word_tokenize(sentence)
+        # Tier 1: keyword prefilter on the raw message
+        if not self.prefilter(self.commit.msg):
+            self.discarded_by = 'prefilter'
+            return []
 
-            # remove all tokens that are not alphabetic
-            tokens = [word.strip() for word in tokens if word.isalpha()]
+        # Tier 2: tokenization, and parsing of the sentences with a defect pattern
+        defective = [i for i in range(len(self.sentences)) if self._get_sentence_categories(i) & rules.DEFECT]
 
-            self.sentences.append(tokens)
+        if not defective:
+            self.discarded_by = 'message'
+            return []
+
+        matched = 0
+        for i in defective:
+            matched |= self._get_sentence_dep_categories(i)
+
+        # Tier 3: diff-based checks, only for the categories not matched by the message
+        labels = []
+
+        for label, categories, check in self.CATEGORIES:
+            if matched & categories or (check is not None and getattr(self, check)()):
+                labels.append(label)
+
+        if not labels:
+            self.discarded_by = 'diff'
+
+        return labels
+
+    @classmethod
+    def snapshot(cls, commit: Commit) -> CommitSnapshot:
+        """
+        Return a copy of the commit that can be sent to other processes, and classified as the commit itself.
+
+        Only the data needed by the classifier is copied. The modified files are copied only if the commit message
+        passes the ``prefilter``, as no category can be detected otherwise.
+
+        Parameters
+        ----------
+        commit: Commit
+            The commit to copy.
+
+        Returns
+        -------
+        CommitSnapshot
+            The copy of the commit.
+
+        """
+        snapshot = CommitSnapshot(hash=commit.hash, msg=commit.msg)
+
+        if cls.prefilter(commit.msg):
+            snapshot.modified_files = [cls.snapshot_modified_file(modified_file)
+                                       for modified_file in commit.modified_files
+                                       if modified_file.change_type == ModificationType.MODIFY]
+
+        return snapshot
+
+    @classmethod
+    def snapshot_modified_file(cls, modified_file: ModifiedFile) -> ModifiedFileSnapshot:
+        """
+        Return a copy of a modified file with the data needed by ``is_comment_changed``, ``is_data_changed``,
+        ``is_include_changed``, and ``is_service_changed``.
+
+        Subclasses overriding those methods should extend this method accordingly.
+
+        Parameters
+        ----------
+        modified_file: ModifiedFile
+            The modified file to copy.
+
+        Returns
+        -------
+        ModifiedFileSnapshot
+            The copy of the modified file.
+
+        """
+        return ModifiedFileSnapshot(change_type=modified_file.change_type,
+                                    old_path=modified_file.old_path,
+                                    new_path=modified_file.new_path,
+                                    diff_parsed=modified_file.diff_parsed)
+
+    @classmethod
+    def classify_many(cls,
+                      commits: List[Union[Commit, CommitSnapshot]],
+                      batch_size: int = 1000,
+                      n_process: int = 1,
+                      stats: collections.Counter = None) -> List[List[str]]:
+        """
+        Return the fixing categories of many commits.
+
+        Unlike calling ``classify`` on every commit, the sentences of all the commits are parsed in batch with
+        spaCy's ``nlp.pipe``. The results are the same.
+
+        Parameters
+        ----------
+        commits : List[Union[Commit, CommitSnapshot]]
+            The commits to analyze.
+
+        batch_size : int
+            The number of sentences buffered by spaCy for each batch. Default 1000.
+
+        n_process : int
+            The number of processes used by spaCy to parse the sentences. Default 1.
+
+        stats : collections.Counter
+            If given, it is updated with the number of classified commits (``commits``), the number of commits
+            discarded by each tier (``prefilter``, ``message``, ``diff``), and the number of fixing-commits
+            (``fixing``).
+
+        Returns
+        -------
+        List[List[str]]
+            The fixing categories of every commit, in the same order as ``commits``.
+
+        """
+        classifiers = [cls(commit) for commit in commits]
+
+        # Only the sentences with a defect pattern of commits passing the prefilter are ever parsed
+        to_parse = [(fcc, i) for fcc in classifiers if cls.prefilter(fcc.commit.msg)
+                    for i in range(len(fcc.sentences)) if fcc._get_sentence_categories(i) & rules.DEFECT]
+
+        heads = utils.get_head_dependents_batch((' '.join(fcc.sentences[i]) for fcc, i in to_parse),
+                                                batch_size=batch_size,
+                                                n_process=n_process)
+
+        for (fcc, i), sentence_heads in zip(to_parse, heads):
+            fcc._sentences_dep[i] = ' '.join(sentence_heads)
+
+        labels = [fcc.classify() for fcc in classifiers]
+
+        if stats is not None:
+            stats['commits'] += len(classifiers)
+            stats.update(fcc.discarded_by or 'fixing' for fcc in classifiers)
+
+        return labels
 
     def is_comment_changed(self) -> bool:
         """
@@ -497,13 +1297,7 @@ class FixingCommitClassifier:
             True if the commit fixes a conditional. False, otherwise.
 
         """
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-            if rules.has_defect_pattern(sentence) and rules.has_conditional_pattern(sentence_dep):
-                return True
-
-        return False
+        return self._fixes(rules.CONDITIONAL)
 
     def fixes_configuration_data(self):
         """
@@ -515,21 +1309,7 @@ class FixingCommitClassifier:
             True if the commit fixes configuration data. False, otherwise.
 
         """
-
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-
-            if rules.has_defect_pattern(sentence) \
-                    and (rules.has_storage_configuration_pattern(sentence_dep)
-                         or rules.has_file_configuration_pattern(sentence_dep)
-                         or rules.has_network_configuration_pattern(sentence_dep)
-                         or rules.has_user_configuration_pattern(sentence_dep)
-                         or rules.has_cache_configuration_pattern(sentence_dep)
-                         or self.is_data_changed()):
-                return True
-
-        return False
+        return self._fixes(rules.CONFIGURATION_DATA, self.is_data_changed)
 
     def fixes_dependency(self):
         """
@@ -542,15 +1322,7 @@ class FixingCommitClassifier:
             True if the commit fixes a dependency. False, otherwise.
 
         """
-
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-            if rules.has_defect_pattern(sentence) and (
-                    rules.has_dependency_pattern(sentence_dep) or self.is_include_changed()):
-                return True
-
-        return False
+        return self._fixes(rules.DEPENDENCY, self.is_include_changed)
 
     def fixes_documentation(self):
         """
@@ -562,15 +1334,7 @@ class FixingCommitClassifier:
             True if the commit fixes the documentation. False, otherwise.
 
         """
-
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-            if rules.has_defect_pattern(sentence) and (
-                    rules.has_documentation_pattern(sentence_dep) or self.is_comment_changed()):
-                return True
-
-        return False
+        return self._fixes(rules.DOCUMENTATION, self.is_comment_changed)
 
     def fixes_idempotency(self):
         """
@@ -582,14 +1346,7 @@ class FixingCommitClassifier:
             True if the commit fixes an idempotency. False, otherwise.
 
         """
-
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-            if rules.has_defect_pattern(sentence) and rules.has_idempotency_pattern(sentence_dep):
-                return True
-
-        return False
+        return self._fixes(rules.IDEMPOTENCY)
 
     def fixes_security(self):
         """
@@ -601,14 +1358,7 @@ class FixingCommitClassifier:
             True if the commit fixes security. False, otherwise.
 
         """
-
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-            if rules.has_defect_pattern(sentence) and rules.has_security_pattern(sentence_dep):
-                return True
-
-        return False
+        return self._fixes(rules.SECURITY)
 
     def fixes_service(self):
         """
@@ -620,15 +1370,7 @@ class FixingCommitClassifier:
             True if the commit fixes a service. False, otherwise.
 
         """
-
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-            if rules.has_defect_pattern(sentence) and (
-                    rules.has_service_pattern(sentence_dep) or self.is_service_changed()):
-                return True
-
-        return False
+        return self._fixes(rules.SERVICE, self.is_service_changed)
 
     def fixes_syntax(self):
         """
@@ -640,11 +1382,4 @@ class FixingCommitClassifier:
             True if the commit fixes syntnax. False, otherwise.
 
         """
-
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-            if rules.has_defect_pattern(sentence) and rules.has_syntax_pattern(sentence_dep):
-                return True
-
-        return False
+        return self._fixes(rules.SYNTAX)
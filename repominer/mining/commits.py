@@ -0,0 +1,136 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from pydriller.domain.commit import ModificationType
+
+
+class CommitIndex:
+    """
+    This class indexes the commits of a repository's branch by their chronological position.
+
+    It is built once from the list of commit hashes ordered by creation date, and it is used by the miners to look up
+    the position of a commit, check membership, and sort commits in constant time per commit, instead of scanning
+    the whole history.
+    """
+
+    def __init__(self, hashes: Iterable[str] = ()):
+        """
+        The class constructor.
+
+        Parameters
+        ----------
+        hashes : Iterable[str]
+            Commit hashes ordered by creation date, from the oldest to the newest.
+
+        """
+        self.hashes = list(hashes)
+        self._positions: Dict[str, int] = {sha: i for i, sha in enumerate(self.hashes)}
+
+    def __contains__(self, sha: str) -> bool:
+        return sha in self._positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.hashes)
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def __getitem__(self, position: int) -> str:
+        return self.hashes[position]
+
+    def position(self, sha: str) -> int:
+        """
+        Return the chronological position of a commit.
+
+        Parameters
+        ----------
+        sha : str
+            The commit hash.
+
+        Returns
+        -------
+        int
+            The position of the commit, where 0 is the oldest commit.
+
+        Raises
+        ------
+        ValueError
+            If the commit is not indexed.
+
+        """
+        try:
+            return self._positions[sha]
+        except KeyError:
+            raise ValueError(f'{sha} is not in the commit index.')
+
+    def sorted(self, commits: Iterable[str]) -> List[str]:
+        """
+        Return the indexed commits in chronological order.
+
+        Duplicates and commits that are not indexed are discarded.
+
+        Parameters
+        ----------
+        commits : Iterable[str]
+            Commit hashes to sort.
+
+        Returns
+        -------
+        List[str]
+            The sorted commit hashes.
+
+        """
+        positions = self._positions
+        return sorted({sha for sha in commits if sha in positions}, key=positions.__getitem__)
+
+
+@dataclass
+class ModifiedFileSnapshot:
+    """ This class stores the data of a modified file needed to classify a commit, and can be sent to other processes.
+
+    It exposes the same attributes as PyDriller's ModifiedFile, but only those set by
+    ``FixingCommitClassifier.snapshot`` are populated.
+
+    Attributes
+    ----------
+    change_type : ModificationType
+        The type of change
+    old_path : str
+        The old path of the file
+    new_path : str
+        The new path of the file
+    diff_parsed : Dict[str, List[Tuple[int, str]]]
+        The added and deleted lines
+    source_code : str
+        The source code of the file after the change
+    source_code_before : str
+        The source code of the file before the change
+
+    """
+
+    change_type: ModificationType
+    old_path: str
+    new_path: str
+    diff_parsed: Dict[str, List[Tuple[int, str]]] = field(default_factory=dict)
+    source_code: str = None
+    source_code_before: str = None
+
+
+@dataclass
+class CommitSnapshot:
+    """ This class stores the data of a commit needed to classify it, and can be sent to other processes.
+
+    Attributes
+    ----------
+    hash : str
+        The commit sha
+    msg : str
+        The commit message
+    modified_files : List[ModifiedFileSnapshot]
+        The modified files needed by the classifier
+
+    """
+
+    hash: str
+    msg: str
+    modified_files: List[ModifiedFileSnapshot] = field(default_factory=list)
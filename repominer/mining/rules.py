@@ -1,61 +1,136 @@
+import re
+
+from typing import Dict, Tuple
+
+# Categories of keywords, as bit flags
+DEFECT = 1 << 0
+CONDITIONAL = 1 << 1
+STORAGE_CONFIGURATION = 1 << 2
+FILE_CONFIGURATION = 1 << 3
+NETWORK_CONFIGURATION = 1 << 4
+USER_CONFIGURATION = 1 << 5
+CACHE_CONFIGURATION = 1 << 6
+DEPENDENCY = 1 << 7
+DOCUMENTATION = 1 << 8
+IDEMPOTENCY = 1 << 9
+SECURITY = 1 << 10
+SERVICE = 1 << 11
+SYNTAX = 1 << 12
+
+CONFIGURATION_DATA = STORAGE_CONFIGURATION | FILE_CONFIGURATION | NETWORK_CONFIGURATION | USER_CONFIGURATION \
+                     | CACHE_CONFIGURATION
+
+PATTERNS = {
+    DEFECT: ('error', 'bug', 'fix', 'issu', 'mistake', 'incorrect', 'fault', 'defect', 'flaw'),
+    CONDITIONAL: ('logic', 'condit', 'boolean'),
+    STORAGE_CONFIGURATION: ('sql', 'db', 'databas'),
+    FILE_CONFIGURATION: ('file', 'permiss'),
+    NETWORK_CONFIGURATION: ('network', 'ip', 'address', 'port', 'tcp', 'dhcp'),
+    USER_CONFIGURATION: ('user', 'usernam', 'password'),
+    CACHE_CONFIGURATION: ('cach',),
+    DEPENDENCY: ('requir', 'depend', 'relat', 'order', 'sync', 'compat', 'ensur', 'inherit'),
+    DOCUMENTATION: ('doc', 'comment', 'spec', 'licens', 'copyright', 'notic', 'header', 'readm'),
+    IDEMPOTENCY: ('idempot',),
+    SECURITY: ('vul', 'ssl', 'secr', 'authent', 'password', 'secur', 'cve'),
+    SERVICE: ('servic', 'server'),
+    SYNTAX: ('compil', 'lint', 'warn', 'typo', 'spell', 'indent', 'regex', 'variabl', 'whitespac')
+}
+
+
+def _compile(patterns: Dict[int, Tuple[str, ...]]):
+    """
+    Compile the keywords into a single regular expression, and map every keyword to the categories it matches.
+
+    The expression is a lookahead that reports, at every position of the text, the longest keyword starting there.
+    Therefore, each keyword also matches the categories of the shorter keywords it starts with.
+    """
+    categories = {}
+    for category, keywords in patterns.items():
+        for keyword in keywords:
+            categories[keyword] = categories.get(keyword, 0) | category
+
+    masks = {keyword: 0 for keyword in categories}
+    for keyword in categories:
+        for prefix, category in categories.items():
+            if keyword.startswith(prefix):
+                masks[keyword] |= category
+
+    alternatives = '|'.join(re.escape(keyword) for keyword in sorted(masks, key=len, reverse=True))
+    return re.compile(f'(?=({alternatives}))'), masks
+
+
+_matcher, _masks = _compile(PATTERNS)
+
+
+def match(text: str) -> int:
+    """
+    Scan the text once for the keywords of all the categories.
+
+    Parameters
+    ----------
+    text : str
+        The text to scan (case-insensitive).
+
+    Returns
+    -------
+    int
+        The bitwise OR of the categories matched by the text (e.g., ``DEFECT | SYNTAX``). 0 if none.
+
+    """
+    mask = 0
+    for keyword in _matcher.finditer(text.lower()):
+        mask |= _masks[keyword.group(1)]
+
+    return mask
+
+
 def has_defect_pattern(text: str) -> bool:
-    string_pattern = ['error', 'bug', 'fix', 'issu', 'mistake', 'incorrect', 'fault', 'defect', 'flaw']
-    return any(word in text.lower() for word in string_pattern)
+    return bool(match(text) & DEFECT)
 
 
 def has_conditional_pattern(text: str) -> bool:
-    string_pattern = ['logic', 'condit', 'boolean']
-    return any(word in text.lower() for word in string_pattern)
+    return bool(match(text) & CONDITIONAL)
 
 
 def has_storage_configuration_pattern(text: str) -> bool:
-    string_pattern = ['sql', 'db', 'databas']
-    return any(word in text.lower() for word in string_pattern)
+    return bool(match(text) & STORAGE_CONFIGURATION)
 
 
 def has_file_configuration_pattern(text: str) -> bool:
-    string_pattern = ['file', 'permiss']
-    return any(word in text.lower() for word in string_pattern)
+    return bool(match(text) & FILE_CONFIGURATION)
 
 
 def has_network_configuration_pattern(text: str) -> bool:
-    string_pattern = ['network', 'ip', 'address', 'port', 'tcp', 'dhcp']
-    return any(word in text.lower() for word in string_pattern)
+    return bool(match(text) & NETWORK_CONFIGURATION)
 
 
 def has_user_configuration_pattern(text: str) -> bool:
-    string_pattern = ['user', 'usernam', 'password']
-    return any(word in text.lower() for word in string_pattern)
+    return bool(match(text) & USER_CONFIGURATION)
 
 
 def has_cache_configuration_pattern(text: str) -> bool:
-    return 'cach' in text.lower()
+    return bool(match(text) & CACHE_CONFIGURATION)
 
 
 def has_dependency_pattern(text: str) -> bool:
-    string_pattern = ['requir', 'depend', 'relat', 'order', 'sync', 'compat', 'ensur', 'inherit']
-    return any(word in text.lower() for word in string_pattern)
+    return bool(match(text) & DEPENDENCY)
 
 
 def has_documentation_pattern(text: str) -> bool:
-    string_pattern = ['doc', 'comment', 'spec', 'licens', 'copyright', 'notic', 'header', 'readm']
-    return any(word in text.lower() for word in string_pattern)
+    return bool(match(text) & DOCUMENTATION)
 
 
 def has_idempotency_pattern(text: str) -> bool:
-    return 'idempot' in text.lower()
+    return bool(match(text) & IDEMPOTENCY)
 
 
 def has_security_pattern(text: str) -> bool:
-    string_pattern = ['vul', 'ssl', 'secr', 'authent', 'password', 'secur', 'cve']
-    return any(word in text.lower() for word in string_pattern)
+    return bool(match(text) & SECURITY)
 
 
 def has_service_pattern(text: str) -> bool:
-    string_pattern = ['servic', 'server']
-    return any(word in text.lower() for word in string_pattern)
+    return bool(match(text) & SERVICE)
 
 
 def has_syntax_pattern(text: str) -> bool:
-    string_pattern = ['compil', 'lint', 'warn', 'typo', 'spell', 'indent', 'regex', 'variabl', 'whitespac']
-    return any(word in text.lower() for word in string_pattern)
+    return bool(match(text) & SYNTAX)
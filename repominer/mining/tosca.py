@@ -1,9 +1,10 @@
 from pydriller.repository import Repository
 from pydriller.domain.commit import ModificationType
 
-from typing import List
+from typing import List, Union
 
 from repominer import filters
+from repominer.files import LazyContent
 from repominer.mining.base import BaseMiner
 
 
@@ -11,7 +12,7 @@ class ToscaMiner(BaseMiner):
     """ This class extends the BaseMiner to mine TOSCA-based repositories
     """
 
-    def ignore_file(self, path_to_file: str, content: str = None):
+    def ignore_file(self, path_to_file: str, content: Union[str, LazyContent] = None):
         """
         Ignore non-TOSCA files.
 
@@ -20,8 +21,8 @@ class ToscaMiner(BaseMiner):
         path_to_file: str
             The filepath (e.g., repominer/mining/base.py).
 
-        content: str
-            The file content.
+        content: Union[str, LazyContent]
+            The file content, or a LazyContent loading it on first call.
 
         Returns
         -------
@@ -1,28 +1,117 @@
+import functools
 import re
-import spacy
-from typing import List
+from typing import Iterable, List, Optional
 
-nlp = spacy.load("en_core_web_sm")
+try:
+    import importlib.metadata as importlib_metadata
+except ImportError:  # Python < 3.8
+    import importlib_metadata
 
+# spaCy model used to parse commit messages
+SPACY_MODEL = 'en_core_web_sm'
 
-def get_head_dependents(sentence: str) -> List[str]:
+# NLTK resources used to tokenize commit messages: (resource path, package name)
+NLTK_RESOURCES = (
+    ('tokenizers/punkt', 'punkt'),
+    ('corpora/stopwords', 'stopwords')
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_nlp():
     """
-    Compute the syntactic dependencies and
-    return a list of tuples (head, dependents)
+    Return spaCy's English model.
+
+    The model is loaded on first use, and then cached for the lifetime of the process.
+
+    Return
+    ------
+    spacy.language.Language
+        The en_core_web_sm model.
+
+    """
+    import spacy
+    return spacy.load(SPACY_MODEL)
+
+
+def get_nlp_version() -> str:
+    """
+    Return the versions of spaCy and of its English model, as installed, without importing spaCy.
+
+    Return
+    ------
+    str
+        The versions, e.g., 'spacy==2.3.5 en_core_web_sm==2.3.1'. A version is None if the package is not installed.
+
+    """
+    return f'spacy=={_get_package_version("spacy")} {SPACY_MODEL}=={_get_package_version(SPACY_MODEL)}'
+
+
+def _get_package_version(name: str) -> Optional[str]:
+    try:
+        return importlib_metadata.version(name)
+    except importlib_metadata.PackageNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_nltk():
+    """
+    Return the nltk module, after making sure that the resources in NLTK_RESOURCES are available.
+
+    Missing resources are downloaded on first use, rather than when importing repominer.
+
+    Return
+    ------
+    module
+        The nltk module.
+
+    """
+    import nltk
+
+    for resource, package in NLTK_RESOURCES:
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            nltk.download(package)
+
+    return nltk
+
+
+def warmup() -> None:
+    """
+    Load the NLP resources in advance.
+
+    Call this function to pay the loading cost upfront, for example when starting a worker process, rather than
+    when the first commit is classified.
+    """
+    get_nltk()
+    get_nlp()
+
+
+def __getattr__(name):
+    # Backward compatibility: the spaCy model used to be loaded at import time as utils.nlp
+    if name == 'nlp':
+        return get_nlp()
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def _get_head_dependents(doc) -> List[str]:
+    """
+    Return the roots and direct objects of a parsed sentence.
 
     Parameters
     ----------
-    sentence : str
-        The sentence to analyze
+    doc : spacy.tokens.Doc
+        The parsed sentence
 
     Return
     ------
-    str
-        A list of tuples (head, dependents).
+    List[str]
+        The text of the roots and direct objects, in order of appearance.
 
     """
-    sentence = re.sub(r'\s+', ' ', sentence)
-    doc = nlp(sentence)
     dep = [token.dep_ for token in doc]
 
     # Get list of compounds in doc
@@ -38,6 +127,51 @@ def get_head_dependents(sentence: str) -> List[str]:
     return [token.text for token in doc if dep[token.i] in ('ROOT', 'dobj')]
 
 
+def get_head_dependents(sentence: str) -> List[str]:
+    """
+    Compute the syntactic dependencies and
+    return a list of tuples (head, dependents)
+
+    Parameters
+    ----------
+    sentence : str
+        The sentence to analyze
+
+    Return
+    ------
+    str
+        A list of tuples (head, dependents).
+
+    """
+    sentence = re.sub(r'\s+', ' ', sentence)
+    return _get_head_dependents(get_nlp()(sentence))
+
+
+def get_head_dependents_batch(sentences: Iterable[str], batch_size: int = 1000, n_process: int = 1) -> List[List[str]]:
+    """
+    Compute the syntactic dependencies of many sentences at once, using spaCy's nlp.pipe.
+
+    Parameters
+    ----------
+    sentences : Iterable[str]
+        The sentences to analyze
+
+    batch_size : int
+        The number of sentences buffered by spaCy for each batch. Default 1000.
+
+    n_process : int
+        The number of processes used by spaCy to parse the sentences. Default 1.
+
+    Return
+    ------
+    List[List[str]]
+        For each sentence, the same result as ``get_head_dependents``.
+
+    """
+    sentences = (re.sub(r'\s+', ' ', sentence) for sentence in sentences)
+    return [_get_head_dependents(doc) for doc in get_nlp().pipe(sentences, batch_size=batch_size, n_process=n_process)]
+
+
 def key_value_list(d):
     """
     This function iterates over all the key-value pairs of a dictionary and
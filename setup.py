@@ -23,11 +23,10 @@ setup(name='repository-miner',
       license='Apache License',
       package_dir={'repominer': 'repominer'},
       packages=find_packages(exclude=('tests',)),
-      python_requires='>=3.6',
+      python_requires='>=3.7',
       classifiers=[
           "Development Status :: 5 - Production/Stable",
           "Intended Audience :: Developers",
-          "Programming Language :: Python :: 3.6",
           "Programming Language :: Python :: 3.7",
           "Programming Language :: Python :: 3.8",
           "Programming Language :: Python :: 3.9",
@@ -35,5 +34,8 @@ setup(name='repository-miner',
           "Topic :: Software Development :: Libraries :: Python Modules",
           "Operating System :: POSIX :: Linux"
       ],
-      install_requires=requirements
+      install_requires=requirements,
+      extras_require={
+          'arrow': ['pyarrow>=3.0']
+      }
 )
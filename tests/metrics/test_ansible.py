@@ -45,6 +45,9 @@ class BaseMetricsExtractorTestSuite(unittest.TestCase):
         self.assertFalse(self.me.ignore_file(path_to_file='tasks/task1.yml'))
         self.assertTrue(self.me.ignore_file(path_to_file='others/useless.py'))
 
+    def test_select_files(self):
+        self.assertListEqual(self.me.select_files(['tasks/task1.yml', 'others/useless.py']), [True, False])
+
     def test_extract_at_commit(self):
 
         self.me.extract([], product=False, process=False, delta=False)
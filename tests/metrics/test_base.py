@@ -1,9 +1,25 @@
 import os
+import pandas as pd
 import unittest
 import shutil
 
+from pydriller.git import Git
+
+from repominer.cache import ProductMetricsCache
 from repominer.files import FailureProneFile
-from repominer.metrics.base import BaseMetricsExtractor, is_remote, get_content
+from repominer.metrics.dataset import CSVSink
+from repominer.metrics.base import BaseMetricsExtractor, is_remote, get_blob_content, get_blob_hash, get_content
+
+
+class ExtensionMetricsExtractor(BaseMetricsExtractor):
+    """ A metrics extractor configured in its constructor, to test that the configuration reaches the processes """
+
+    def __init__(self, *args, extension: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.extension = extension
+
+    def ignore_file(self, path_to_file, content=None):
+        return not path_to_file.endswith(self.extension)
 
 
 class BaseMetricsExtractorTestSuite(unittest.TestCase):
@@ -43,6 +59,20 @@ class BaseMetricsExtractorTestSuite(unittest.TestCase):
 
         self.assertIsNone(get_content(path_to_file))
 
+    def test_get_blob_hash(self):
+        # As git hash-object
+        self.assertEqual(get_blob_hash(''), 'e69de29bb2d1d6434b8b29ae775ad8c2e48c5391')
+        self.assertEqual(get_blob_hash('hello\n'), 'ce013625030ba8dba906f756967f9e9ca394464a')
+
+    def test_product_metrics_version(self):
+        class PandasMetricsExtractor(BaseMetricsExtractor):
+            METRICS_LIBRARY = 'pandas'
+
+        version = PandasMetricsExtractor.product_metrics_version()
+        self.assertTrue(version.startswith(f'pandas=={pd.__version__}+'))
+        self.assertEqual(version, PandasMetricsExtractor.product_metrics_version())
+        self.assertNotEqual(version, BaseMetricsExtractor.product_metrics_version())
+
     def test_init_ValueError_1(self):
         with self.assertRaises(ValueError):
             BaseMetricsExtractor(path_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing',
@@ -98,6 +128,18 @@ class BaseMetricsExtractorTestSuite(unittest.TestCase):
                 'test_is_comment_changed-renamed.py'
             })
 
+    def test_get_blobs(self):
+        me = BaseMetricsExtractor(path_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing',
+                                  clone_repo_to=self.path_to_tmp_dir,
+                                  at='release')
+
+        git_repo = Git(me.path_to_repo)
+        blobs = me.get_blobs(git_repo, git_repo.repo.head.commit.hexsha)
+
+        self.assertEqual(set(blobs), me.get_files())
+        self.assertEqual(get_blob_content(git_repo, blobs['README.md']),
+                         get_content(os.path.join(me.path_to_repo, 'README.md')))
+
     def test_get_product_metrics__abstract(self):
         me = BaseMetricsExtractor(path_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing',
                                   clone_repo_to=self.path_to_tmp_dir,
@@ -178,6 +220,106 @@ class BaseMetricsExtractorTestSuite(unittest.TestCase):
         self.assertEqual(me.dataset.failure_prone.to_list().count(0), 8)
         self.assertEqual(me.dataset.failure_prone.to_list().count(1), 1)
 
+    def test_extract__labeled_files_iterable(self):
+        me = BaseMetricsExtractor(path_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing',
+                                  clone_repo_to=self.path_to_tmp_dir,
+                                  at='release')
+
+        labeled_files = [FailureProneFile(filepath='test_is_comment_changed.py',
+                                          commit='d39fdb44e98869835fe59a86d20d05a9e82d5282',
+                                          fixing_commit='75da5889425815009cc0eb4bdff68f59024d351f')]
+
+        me.extract(labeled_files, product=False, process=False, delta=False)
+        dataset = me.dataset
+
+        me.extract((file for file in labeled_files), product=False, process=False, delta=False)
+        pd.testing.assert_frame_equal(me.dataset, dataset)
+        self.assertEqual(me.dataset.failure_prone.to_list().count(1), 1)
+
+    def test_extract_without_checkout(self):
+        me = BaseMetricsExtractor(path_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing',
+                                  clone_repo_to=self.path_to_tmp_dir,
+                                  at='release')
+
+        labeled_files = [FailureProneFile(filepath='test_is_comment_changed.py',
+                                          commit='d39fdb44e98869835fe59a86d20d05a9e82d5282',
+                                          fixing_commit='75da5889425815009cc0eb4bdff68f59024d351f')]
+
+        me.extract(labeled_files, product=True, process=True, delta=True)
+        dataset = me.dataset.sort_values(['commit', 'filepath']).reset_index(drop=True)
+
+        me.extract(labeled_files, product=True, process=True, delta=True, checkout=False)
+        pd.testing.assert_frame_equal(me.dataset.sort_values(['commit', 'filepath']).reset_index(drop=True), dataset)
+
+    def test_extract__num_processes(self):
+        me = BaseMetricsExtractor(path_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing',
+                                  clone_repo_to=self.path_to_tmp_dir,
+                                  at='commit')
+
+        labeled_files = [FailureProneFile(filepath='test_is_comment_changed.py',
+                                          commit='d39fdb44e98869835fe59a86d20d05a9e82d5282',
+                                          fixing_commit='75da5889425815009cc0eb4bdff68f59024d351f')]
+
+        me.extract(labeled_files, product=True, process=True, delta=True, checkout=False)
+        dataset = me.dataset
+
+        me.extract(labeled_files, product=True, process=True, delta=True, num_processes=2)
+        pd.testing.assert_frame_equal(me.dataset, dataset)
+
+    def test_extract__num_processes_subclass_state(self):
+        me = ExtensionMetricsExtractor(path_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing',
+                                       clone_repo_to=self.path_to_tmp_dir,
+                                       at='release',
+                                       extension='.py')
+
+        me.extract([], product=True, process=False, delta=False, checkout=False)
+        dataset = me.dataset
+        self.assertFalse(dataset.empty)
+        self.assertTrue(dataset.filepath.str.endswith('.py').all())
+
+        me.extract([], product=True, process=False, delta=False, num_processes=2)
+        pd.testing.assert_frame_equal(me.dataset, dataset)
+
+    def test_extract__product_metrics_cache(self):
+        me = BaseMetricsExtractor(path_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing',
+                                  clone_repo_to=self.path_to_tmp_dir,
+                                  at='commit')
+
+        path_to_cache = os.path.join(self.path_to_tmp_dir, 'cache.db')
+        with ProductMetricsCache(path_to_cache) as cache:
+            me.extract([], product=True, process=False, delta=True, checkout=False, cache=cache)
+            dataset = me.dataset
+
+        analysed = []
+        me = BaseMetricsExtractor(path_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing',
+                                  clone_repo_to=self.path_to_tmp_dir,
+                                  at='commit')
+        me.get_product_metrics = lambda script: analysed.append(script) or {}
+
+        with ProductMetricsCache(path_to_cache) as cache:
+            me.extract([], product=True, process=False, delta=True, checkout=False, cache=cache)
+
+        self.assertEqual(analysed, [])
+        pd.testing.assert_frame_equal(me.dataset, dataset)
+
+    def test_extract__sink(self):
+        me = BaseMetricsExtractor(path_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing',
+                                  clone_repo_to=self.path_to_tmp_dir,
+                                  at='release')
+
+        me.extract([], product=True, process=True, delta=True)
+        path_to_csv = os.path.join(self.path_to_tmp_dir, 'metrics.csv')
+        me.to_csv(path_to_csv)
+        dataset = pd.read_csv(path_to_csv)
+
+        path_to_sink = os.path.join(self.path_to_tmp_dir, 'metrics_sink.csv')
+        with CSVSink(path_to_sink) as sink:
+            me.extract([], product=True, process=True, delta=True, sink=sink)
+
+        self.assertTrue(me.dataset.empty)
+        pd.testing.assert_frame_equal(pd.read_csv(path_to_sink).sort_values(['commit', 'filepath']).reset_index(drop=True),
+                                      dataset.sort_values(['commit', 'filepath']).reset_index(drop=True))
+
     def test_extract_at_commit(self):
         me = BaseMetricsExtractor(path_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing',
                                   clone_repo_to=self.path_to_tmp_dir,
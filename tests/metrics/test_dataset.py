@@ -0,0 +1,181 @@
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from repominer.metrics.dataset import CallbackSink, ColumnarBuffer, CSVSink, JSONLinesSink, RowSink, metrics_schema, \
+    read_dataset, write_dataset
+
+
+class ColumnarBufferTestCase(unittest.TestCase):
+
+    def test_to_dataframe(self):
+        buffer = ColumnarBuffer()
+        buffer.append({'filepath': 'a.yml', 'lines_code': 10, 'failure_prone': True})
+        buffer.append({'filepath': 'b.yml', 'lines_code': 20, 'failure_prone': False})
+
+        dataset = buffer.to_dataframe()
+        self.assertEqual(len(buffer), 2)
+        self.assertListEqual(list(dataset.columns), ['filepath', 'lines_code', 'failure_prone'])
+        self.assertListEqual(dataset.lines_code.tolist(), [10, 20])
+        self.assertEqual(dataset.lines_code.dtype, 'int64')
+
+    def test_missing_columns(self):
+        buffer = ColumnarBuffer()
+        buffer.append({'filepath': 'a.yml', 'lines_code': 10})
+        buffer.append({'filepath': 'b.yml', 'num_tasks': 3})
+        buffer.append({'filepath': 'c.yml'})
+
+        dataset = buffer.to_dataframe()
+        self.assertListEqual(list(dataset.columns), ['filepath', 'lines_code', 'num_tasks'])
+        self.assertTrue(all(len(column) == 3 for column in buffer.columns.values()))
+        self.assertEqual(dataset.lines_code[0], 10)
+        self.assertTrue(pd.isna(dataset.lines_code[1]) and pd.isna(dataset.lines_code[2]))
+        self.assertTrue(pd.isna(dataset.num_tasks[0]))
+        self.assertEqual(dataset.num_tasks[1], 3)
+
+    def test_empty(self):
+        buffer = ColumnarBuffer()
+        self.assertTrue(buffer.to_dataframe().empty)
+
+        buffer.append({'filepath': 'a.yml'})
+        buffer.clear()
+        self.assertEqual(len(buffer), 0)
+        self.assertTrue(buffer.to_dataframe().empty)
+
+    def test_extend(self):
+        buffer = ColumnarBuffer()
+        buffer.extend([{'filepath': 'a.yml'}, {'filepath': 'b.yml', 'lines_code': 1}])
+
+        self.assertEqual(len(buffer), 2)
+        self.assertListEqual(buffer.columns['lines_code'], [None, 1])
+
+
+class RowSinkTestCase(unittest.TestCase):
+    releases = [
+        [{'filepath': 'a.yml', 'commit': 'c1', 'lines_code': 10}, {'filepath': 'b.yml', 'commit': 'c1'}],
+        [],
+        [{'filepath': 'a.yml', 'commit': 'c2', 'lines_code': 12, 'delta_lines_code': 2}],
+        [{'filepath': 'b.yml', 'commit': 'c3', 'text_entropy': 4.52}]
+    ]
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def expected(self) -> pd.DataFrame:
+        buffer = ColumnarBuffer()
+        for rows in self.releases:
+            buffer.extend(rows)
+
+        return buffer.to_dataframe()
+
+    def test_abstract_sink(self):
+        class IncompleteSink(RowSink):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteSink()
+
+    def test_csv_sink(self):
+        path = os.path.join(self.tmp_dir.name, 'metrics.csv')
+
+        with CSVSink(path) as sink:
+            sink.write(self.releases[0])
+            pd.testing.assert_frame_equal(pd.read_csv(path), pd.DataFrame(self.releases[0]))
+
+            for rows in self.releases[1:]:
+                sink.write(rows)
+
+        self.assertListEqual(sink.columns, ['filepath', 'commit', 'lines_code', 'delta_lines_code', 'text_entropy'])
+        self.assertFalse(os.path.exists(f'{path}.tmp'))
+        pd.testing.assert_frame_equal(pd.read_csv(path), self.expected())
+
+    def test_jsonlines_sink(self):
+        path = os.path.join(self.tmp_dir.name, 'metrics.jsonl')
+
+        with JSONLinesSink(path) as sink:
+            for rows in self.releases:
+                sink.write(rows)
+
+        with open(path) as f:
+            self.assertListEqual([json.loads(line) for line in f], [row for rows in self.releases for row in rows])
+
+    def test_callback_sink(self):
+        written = []
+
+        with CallbackSink(written.append) as sink:
+            for rows in self.releases:
+                sink.write(rows)
+
+        self.assertListEqual(written, self.releases)
+
+
+@unittest.skipIf(importlib.util.find_spec('pyarrow') is None, 'pyarrow is not installed')
+class ColumnarFormatsTestCase(unittest.TestCase):
+    metric_types = {'lines_code': int, 'text_entropy': float}
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        buffer = ColumnarBuffer()
+        buffer.extend(RowSinkTestCase.releases[0])
+        buffer.extend([{'filepath': 'a.yml', 'commit': 'c2', 'lines_code': 12, 'code_churn_avg': 2,
+                        'text_entropy': 4.52, 'delta_lines_code': 2}])
+        buffer.extend([{'filepath': 'b.yml', 'commit': 'c3', 'lines_code': 3, 'code_churn_avg': 1,
+                        'text_entropy': 4.0}])
+        self.dataset = buffer.to_dataframe()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_metrics_schema(self):
+        import pyarrow as pa
+
+        schema = metrics_schema(list(self.dataset.columns) + ['failure_prone', 'delta_text_entropy', 'other'],
+                                self.metric_types)
+        self.assertEqual(schema.field('filepath').type, pa.dictionary(pa.int32(), pa.string()))
+        self.assertEqual(schema.field('commit').type, pa.dictionary(pa.int32(), pa.string()))
+        self.assertEqual(schema.field('failure_prone').type, pa.int64())
+        self.assertEqual(schema.field('lines_code').type, pa.int64())
+        self.assertEqual(schema.field('delta_lines_code').type, pa.int64())
+        self.assertEqual(schema.field('code_churn_avg').type, pa.float64())
+        self.assertEqual(schema.field('text_entropy').type, pa.float64())
+        self.assertEqual(schema.field('delta_text_entropy').type, pa.float64())
+        self.assertEqual(schema.field('other').type, pa.float64())
+
+    def test_write_read(self):
+        for format in ('parquet', 'feather', 'arrow'):
+            for partition_by_release in (False, True):
+                with self.subTest(format=format, partition_by_release=partition_by_release):
+                    path = os.path.join(self.tmp_dir.name, f'metrics{int(partition_by_release)}.{format}')
+                    write_dataset(self.dataset, path, format=format, partition_by_release=partition_by_release,
+                                  metric_types=self.metric_types)
+
+                    if partition_by_release:
+                        self.assertListEqual(sorted(os.listdir(path)), [f'0-c1.{format}', f'1-c2.{format}',
+                                                                        f'2-c3.{format}'])
+
+                    dataset = read_dataset(path)
+                    self.assertIsInstance(dataset.filepath.dtype, pd.CategoricalDtype)
+                    self.assertIsInstance(dataset.commit.dtype, pd.CategoricalDtype)
+                    pd.testing.assert_frame_equal(dataset.astype({'filepath': object, 'commit': object}),
+                                                  self.dataset.astype({'filepath': object, 'commit': object}),
+                                                  check_dtype=False)
+
+                    dataset = read_dataset(path, columns=['commit', 'lines_code'])
+                    self.assertListEqual(list(dataset.columns), ['commit', 'lines_code'])
+                    self.assertEqual(len(dataset), 4)
+
+    def test_write_unknown_format(self):
+        with self.assertRaises(ValueError):
+            write_dataset(self.dataset, os.path.join(self.tmp_dir.name, 'metrics.xlsx'), format='xlsx')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import unittest
+import shutil
+
+from unittest import mock
+
+from pydriller.git import Git
+from pydriller.repository import Repository
+
+from repominer.metrics.base import BaseMetricsExtractor
+from repominer.metrics.process import ProcessFacts, count_hunks
+
+
+class ProcessFactsTestSuite(unittest.TestCase):
+    path_to_tmp_dir = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.path_to_tmp_dir = os.path.join(os.getcwd(), 'test_data', 'tmp')
+        os.mkdir(cls.path_to_tmp_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.path_to_tmp_dir)
+
+    def test_count_hunks(self):
+        self.assertEqual(count_hunks(''), 0)
+        self.assertEqual(count_hunks('@@ -1,2 +1,2 @@\n-a\n+b\n c'), 1)
+        self.assertEqual(count_hunks('@@ -1,4 +1,4 @@\n-a\n+b\n c\n-d\n+e\n@@ -9 +9 @@\n+f'), 3)
+
+    def test_get_process_metrics(self):
+        me = BaseMetricsExtractor(path_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing',
+                                  clone_repo_to=self.path_to_tmp_dir,
+                                  at='commit')
+
+        facts = ProcessFacts(Git(me.path_to_repo))
+        for commit in Repository(me.path_to_repo, order='date-order').traverse_commits():
+            facts.add(commit, commit.modified_files)
+
+        periods = list(zip(me.commits_at, me.commits_at[1:]))
+        periods.append((me.commits_at[0], me.commits_at[0]))
+        periods.append(('d39fdb44e98869835fe59a86d20d05a9e82d5282', 'c029d7520456e5468d66b56fe176146680520b20'))
+
+        for from_commit, to_commit in periods:
+            expected = me.get_process_metrics(from_commit=from_commit, to_commit=to_commit)
+            actual = facts.get_process_metrics(from_commit=from_commit, to_commit=to_commit)
+
+            for metric, value in expected.items():
+                if isinstance(value, dict):
+                    # Deleted files are counted under None
+                    value = {filepath: v for filepath, v in value.items() if filepath is not None}
+
+                self.assertEqual(actual[metric], value)
+
+    def test_get_commits__git_before_2_38(self):
+        me = BaseMetricsExtractor(path_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing',
+                                  clone_repo_to=self.path_to_tmp_dir,
+                                  at='commit')
+
+        git_repo = Git(me.path_to_repo)
+        facts = ProcessFacts(git_repo)
+        periods = list(zip(me.commits_at, me.commits_at[2:]))
+        periods.append((me.commits_at[-1], me.commits_at[0]))
+
+        expected = [facts.get_commits(from_commit, to_commit) for from_commit, to_commit in periods]
+
+        with mock.patch.object(type(git_repo.repo.git), 'version_info', new_callable=mock.PropertyMock,
+                               return_value=(2, 34, 1)):
+            actual = [facts.get_commits(from_commit, to_commit) for from_commit, to_commit in periods]
+
+        self.assertListEqual([sorted(commits) for commits in actual], [sorted(commits) for commits in expected])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -74,6 +74,66 @@ class AnsibleMinerTestSuite(unittest.TestCase):
         )
         # Do sth with commit_labels
 
+    def test_get_fixing_commits__processes(self):
+        self.miner.fixing_commits = []
+        commit_labels = self.miner.get_fixing_commits()
+        fixing_commits = self.miner.fixing_commits
+        stats = self.miner.classification_stats
+
+        self.miner.fixing_commits = []
+        self.assertDictEqual(self.miner.get_fixing_commits(num_processes=2, chunk_size=3), commit_labels)
+        self.assertEqual(self.miner.fixing_commits, fixing_commits)
+        self.assertEqual(self.miner.classification_stats, stats)
+
+    def test_get_fixing_commits__stats(self):
+        self.miner.fixing_commits = []
+        self.miner.get_fixing_commits()
+        stats = self.miner.classification_stats
+
+        self.assertEqual(stats['commits'], stats['prefilter'] + stats['message'] + stats['diff'] + stats['fixing'])
+        self.assertGreaterEqual(stats['fixing'], len(self.miner.fixing_commits))
+
+    def test_save_load_state(self):
+        self.miner.fixing_commits = []
+        self.miner.get_fixing_commits()
+        self.miner.get_fixed_files()
+
+        path_to_state = os.path.join(self.path_to_tmp_dir, 'state.json')
+        self.miner.save_state(path_to_state)
+
+        miner = AnsibleMiner(
+            url_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing.git',
+            clone_repo_to=os.path.join(os.getcwd(), 'test_data', 'tmp'),
+            branch='origin/test-ansible-miner'
+        )
+        miner.load_state(path_to_state)
+
+        self.assertEqual(miner.commit_hashes, self.miner.commit_hashes)
+        self.assertEqual(miner.fixing_commits, self.miner.fixing_commits)
+        self.assertDictEqual(miner.fixing_commits_labels, self.miner.fixing_commits_labels)
+        self.assertEqual(miner.fixed_files, self.miner.fixed_files)
+
+        # No new commits to classify, and no new fixing-commits to blame
+        self.assertDictEqual(miner.get_fixing_commits(), {})
+        self.assertEqual(miner.classification_stats['commits'], 0)
+
+        miner.get_fixed_files()
+        self.assertEqual([(file.filepath, file.fic, file.bic) for file in miner.fixed_files],
+                         [(file.filepath, file.fic, file.bic) for file in self.miner.fixed_files])
+
+    def test_load_state__wrong_branch(self):
+        path_to_state = os.path.join(self.path_to_tmp_dir, 'state-wrong-branch.json')
+        self.miner.save_state(path_to_state)
+
+        miner = AnsibleMiner(
+            url_to_repo='https://github.com/stefanodallapalma/radon-repository-miner-testing.git',
+            clone_repo_to=os.path.join(os.getcwd(), 'test_data', 'tmp'),
+            branch='origin/test-base-miner-commits'
+        )
+
+        with self.assertRaises(ValueError):
+            miner.load_state(path_to_state)
+
     def test_get_fixed_files(self):
 
         self.miner.fixing_commits = [
@@ -104,6 +164,28 @@ class AnsibleMinerTestSuite(unittest.TestCase):
 
         self.assertEqual(self.miner.fixed_files, [ff1, ff2, ff3])
 
+    def test_get_fixed_files__workers(self):
+        self.miner.fixing_commits = [
+            '755efda3359954588c8486272b17979b3a6512a2',
+            'e7df3e45e2e27a0dc16806a834b50d0856d350fe',
+            '70257245257cd899b6f26870e8db11f5b66a4676',
+            '73377dbdd160cc69898caa0e97975f12172bba41',
+            '07d2c6720718e498598e64f24a14b992b29bdf61',
+            '4428cdf62d124df67fa87c29ace3db6906504ea4',
+            '64f813de2a78fd17d898072a0d118234c1235fad',
+            'fa1523351a14b6f0543cd49a131ed8aaed594fdb',
+            '68195f290a09d119d2e334ed6a8add79ecf2ce5b'
+        ]
+
+        self.miner.get_fixed_files(num_workers=1)
+        fixed_files = [(file.filepath, file.fic, file.bic) for file in self.miner.fixed_files]
+
+        self.miner._szz_events.clear()
+        self.miner._szz_blamed.clear()
+        self.miner.get_fixed_files(num_workers=4)
+
+        self.assertEqual([(file.filepath, file.fic, file.bic) for file in self.miner.fixed_files], fixed_files)
+
     def test_label__no_commits(self):
         self.miner.fixing_commits = []
         self.miner.fixed_files = [
@@ -1,6 +1,9 @@
 import copy
 import unittest
 
+from unittest import mock
+
+from repominer import utils
 from repominer.mining.base import FixingCommitClassifier
 from pydriller.repository import Repository
 
@@ -94,3 +97,40 @@ class BaseFixingCommitClassifierTestSuite(unittest.TestCase):
         commit_tmp = copy.deepcopy(self.commit)
         commit_tmp._c_object.message = 'Fixes keystone token after deploying keystone to minimize security risk.'
         self.assertTrue(FixingCommitClassifier(commit_tmp).fixes_security())
+
+    def test_classify(self):
+        self.assertListEqual(FixingCommitClassifier(self.commit).classify(), [])
+
+        commit_tmp = copy.deepcopy(self.commit)
+        commit_tmp._c_object.message = 'Fix Ansible Linter issues. Fix nginx service that did not started the server.'
+        self.assertListEqual(FixingCommitClassifier(commit_tmp).classify(), ['SERVICE', 'SYNTAX'])
+
+    def test_classify__parse_once(self):
+        commit_tmp = copy.deepcopy(self.commit)
+        commit_tmp._c_object.message = 'Fix Ansible Linter issues. Fix nginx service that did not started the server.'
+
+        with mock.patch.object(utils, 'get_head_dependents', wraps=utils.get_head_dependents) as parser:
+            FixingCommitClassifier(commit_tmp).classify()
+            self.assertEqual(parser.call_count, 2)
+
+    def test_classify_many(self):
+        commit_tmp = copy.deepcopy(self.commit)
+        commit_tmp._c_object.message = 'Fix Ansible Linter issues. Fix nginx service that did not started the server.'
+
+        self.assertListEqual(FixingCommitClassifier.classify_many([self.commit, commit_tmp], batch_size=1),
+                             [[], ['SERVICE', 'SYNTAX']])
+
+    def test_classify__discarded_by(self):
+        fcc = FixingCommitClassifier(self.commit)
+        fcc.classify()
+        self.assertEqual(fcc.discarded_by, 'prefilter')
+
+        commit_tmp = copy.deepcopy(self.commit)
+        commit_tmp._c_object.message = 'Fix Ansible Linter issues.'
+        fcc = FixingCommitClassifier(commit_tmp)
+        fcc.classify()
+        self.assertIsNone(fcc.discarded_by)
+
+    def test_prefilter(self):
+        self.assertTrue(FixingCommitClassifier.prefilter('Fix Ansible Linter issues.'))
+        self.assertFalse(FixingCommitClassifier.prefilter('Initial commit'))
@@ -2,7 +2,9 @@ import os
 import shutil
 import unittest
 
-from repominer.mining.base import BaseMiner
+from git import Repo
+
+from repominer.mining.base import BaseMiner, _line_ranges
 from repominer.files import FixedFile
 
 
@@ -43,6 +45,10 @@ class TestBaseMiner(unittest.TestCase):
                                                'bf4e8b3b47a594a40a10183f7f5f013a248bc4f9',  # Jun 1st 13:54
                                                '730d5fcb9bcba1b6b8d7d14ab9dff45031f194e5'])  # Jun 1st 13:55
 
+    def test_line_ranges(self):
+        self.assertEqual(list(_line_ranges([1, 2, 3, 7, 9, 10])), [(1, 3), (7, 7), (9, 10)])
+        self.assertEqual(list(_line_ranges([])), [])
+
     def test_sort_commits(self):
         commits = ['730d5fcb9bcba1b6b8d7d14ab9dff45031f194e5',
                    '3de3d8c2bbccf62ef5698cf33ad258aae5316432',
@@ -153,6 +159,68 @@ class TestBaseMiner(unittest.TestCase):
         for item in miner.label():
             self.assertIsNone(item)
 
+    def init_repo(self, name):
+        """ Create a local repository, and return a function committing to it at a given date """
+        repo = Repo.init(os.path.join(self.path_to_tmp_dir, name))
+        with repo.config_writer() as config:
+            config.set_value('user', 'name', 'test')
+            config.set_value('user', 'email', 'test@test.com')
+
+        def commit(message, parents, minutes):
+            date = f'{1609459200 + 60 * minutes} +0000'  # Minutes after Jan 1st 2021
+            return repo.index.commit(message, parent_commits=parents, head=True, author_date=date, commit_date=date)
+
+        return commit
+
+    def test_label__merge(self):
+        """ History: root -> A, root -> S1 -> S2, merge M of A and S2, fix F """
+        commit = self.init_repo('label-merge')
+
+        root = commit('root', [], 0)
+        a = commit('A', [root], 1)
+        s1 = commit('S1', [root], 2)
+        s2 = commit('S2', [s1], 3)
+        m = commit('M', [a, s2], 4)
+        f = commit('F', [m], 5)
+
+        miner = BaseMiner(
+            url_to_repo='https://github.com/stefanodallapalma/label-merge.git',
+            clone_repo_to=self.path_to_tmp_dir
+        )
+
+        miner.fixing_commits = [f.hexsha]
+        miner.fixed_files = [FixedFile(filepath='a.yml', fic=f.hexsha, bic=a.hexsha),
+                             FixedFile(filepath='b.yml', fic=f.hexsha, bic=s1.hexsha)]
+
+        self.assertListEqual([(file.filepath, file.commit) for file in miner.label()],
+                             [('a.yml', m.hexsha), ('b.yml', m.hexsha),
+                              ('a.yml', s2.hexsha), ('b.yml', s2.hexsha),
+                              ('a.yml', s1.hexsha), ('b.yml', s1.hexsha),
+                              ('a.yml', a.hexsha)])
+
+    def test_label__clock_skew(self):
+        """ History: root -> X, root -> S dated before root, merge M of X and S, fix F.
+        The traversal visits root before S, although S comes after root in the history """
+        commit = self.init_repo('label-clock-skew')
+
+        root = commit('root', [], 0)
+        x = commit('X', [root], 1)
+        s = commit('S', [root], -60)
+        m = commit('M', [x, s], 2)
+        f = commit('F', [m], 3)
+
+        miner = BaseMiner(
+            url_to_repo='https://github.com/stefanodallapalma/label-clock-skew.git',
+            clone_repo_to=self.path_to_tmp_dir
+        )
+
+        miner.fixing_commits = [f.hexsha]
+        miner.fixed_files = [FixedFile(filepath='a.yml', fic=f.hexsha, bic=s.hexsha)]
+
+        self.assertListEqual(miner.commit_hashes, [root.hexsha, s.hexsha, x.hexsha, m.hexsha, f.hexsha])
+        self.assertListEqual([(file.filepath, file.commit) for file in miner.label()],
+                             [('a.yml', m.hexsha), ('a.yml', x.hexsha), ('a.yml', s.hexsha)])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,61 @@
+import pickle
+import unittest
+
+from pydriller.domain.commit import ModificationType
+
+from repominer.mining.commits import CommitIndex, CommitSnapshot, ModifiedFileSnapshot
+
+
+class CommitIndexTestSuite(unittest.TestCase):
+
+    def setUp(self):
+        self.index = CommitIndex(['3de3d8c2bbccf62ef5698cf33ad258aae5316432',
+                                  'bf4e8b3b47a594a40a10183f7f5f013a248bc4f9',
+                                  '730d5fcb9bcba1b6b8d7d14ab9dff45031f194e5'])
+
+    def test_position(self):
+        self.assertEqual(self.index.position('3de3d8c2bbccf62ef5698cf33ad258aae5316432'), 0)
+        self.assertEqual(self.index.position('730d5fcb9bcba1b6b8d7d14ab9dff45031f194e5'), 2)
+
+    def test_position_value_error(self):
+        with self.assertRaises(ValueError):
+            self.index.position('unknown')
+
+    def test_contains(self):
+        self.assertIn('bf4e8b3b47a594a40a10183f7f5f013a248bc4f9', self.index)
+        self.assertNotIn('unknown', self.index)
+
+    def test_sequence(self):
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(self.index[0], '3de3d8c2bbccf62ef5698cf33ad258aae5316432')
+        self.assertEqual(list(self.index), self.index.hashes)
+
+    def test_sorted(self):
+        commits = ['730d5fcb9bcba1b6b8d7d14ab9dff45031f194e5',
+                   'unknown',
+                   '3de3d8c2bbccf62ef5698cf33ad258aae5316432',
+                   '730d5fcb9bcba1b6b8d7d14ab9dff45031f194e5']
+
+        self.assertEqual(self.index.sorted(commits), ['3de3d8c2bbccf62ef5698cf33ad258aae5316432',
+                                                      '730d5fcb9bcba1b6b8d7d14ab9dff45031f194e5'])
+
+    def test_sorted_empty(self):
+        self.assertEqual(CommitIndex().sorted(['3de3d8c2bbccf62ef5698cf33ad258aae5316432']), [])
+
+
+class CommitSnapshotTestSuite(unittest.TestCase):
+
+    def test_pickle(self):
+        snapshot = CommitSnapshot(hash='3de3d8c2bbccf62ef5698cf33ad258aae5316432',
+                                  msg='Fix comment',
+                                  modified_files=[ModifiedFileSnapshot(change_type=ModificationType.MODIFY,
+                                                                       old_path='tasks/main.yml',
+                                                                       new_path='tasks/main.yml',
+                                                                       diff_parsed={'added': [(1, '# comment')],
+                                                                                    'deleted': []})])
+
+        self.assertEqual(pickle.loads(pickle.dumps(snapshot)), snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
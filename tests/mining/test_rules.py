@@ -112,3 +112,11 @@ class RulesTestCase(unittest.TestCase):
     @staticmethod
     def test_has_syntax_pattern_false():
         assert not rules.has_syntax_pattern('refactored code')
+
+    @staticmethod
+    def test_match():
+        assert rules.match('Fix Ansible Linter issues') == rules.DEFECT | rules.SYNTAX
+        assert rules.match('removed hard-coded string PASSWORD') == rules.USER_CONFIGURATION | rules.SECURITY
+        assert rules.match('fix usernames') == rules.DEFECT | rules.USER_CONFIGURATION
+        assert rules.match('refactored code') == 0
+        assert rules.match('') == 0
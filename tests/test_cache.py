@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+from repominer import utils
+from repominer.cache import BlameCache, ClassificationCache, ProductMetricsCache
+from repominer.mining.ansible import AnsibleFixingCommitClassifier
+from repominer.mining.base import FixingCommitClassifier
+
+
+class ClassificationCacheTestSuite(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'cache.db')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_update_load(self):
+        with ClassificationCache(self.path) as cache:
+            cache.update({'3de3d8c2bbccf62ef5698cf33ad258aae5316432': ['syntax', 'service'],
+                          'bf4e8b3b47a594a40a10183f7f5f013a248bc4f9': []}, 'fp1')
+
+        with ClassificationCache(self.path) as cache:
+            self.assertEqual(cache.load('fp1'), {'3de3d8c2bbccf62ef5698cf33ad258aae5316432': ['syntax', 'service'],
+                                                 'bf4e8b3b47a594a40a10183f7f5f013a248bc4f9': []})
+            self.assertEqual(cache.load('fp2'), {})
+
+    def test_update_replace(self):
+        with ClassificationCache(self.path) as cache:
+            cache.update({'3de3d8c2bbccf62ef5698cf33ad258aae5316432': ['syntax']}, 'fp1')
+            cache.update({'3de3d8c2bbccf62ef5698cf33ad258aae5316432': ['service']}, 'fp1')
+            self.assertEqual(cache.load('fp1'), {'3de3d8c2bbccf62ef5698cf33ad258aae5316432': ['service']})
+
+    def test_fingerprint(self):
+        self.assertEqual(FixingCommitClassifier.fingerprint(), FixingCommitClassifier.fingerprint())
+        self.assertNotEqual(FixingCommitClassifier.fingerprint(), AnsibleFixingCommitClassifier.fingerprint())
+
+    def test_fingerprint__nlp_version(self):
+        fingerprint = FixingCommitClassifier.fingerprint()
+
+        with mock.patch.object(utils, 'get_nlp_version', return_value='spacy==2.3.5 en_core_web_sm==0.0.0'):
+            self.assertNotEqual(FixingCommitClassifier.fingerprint(), fingerprint)
+
+
+class BlameCacheTestSuite(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'cache.db')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_put_get(self):
+        with BlameCache(self.path) as cache:
+            cache.put('730d5fcb9bcba1b6b8d7d14ab9dff45031f194e5', 'tasks/main.yml', '-w',
+                      {'3de3d8c2bbccf62ef5698cf33ad258aae5316432', 'bf4e8b3b47a594a40a10183f7f5f013a248bc4f9'})
+            cache.put('730d5fcb9bcba1b6b8d7d14ab9dff45031f194e5', 'tasks/other.yml', '-w', set())
+
+        with BlameCache(self.path) as cache:
+            self.assertEqual(cache.get('730d5fcb9bcba1b6b8d7d14ab9dff45031f194e5', 'tasks/main.yml', '-w'),
+                             {'3de3d8c2bbccf62ef5698cf33ad258aae5316432', 'bf4e8b3b47a594a40a10183f7f5f013a248bc4f9'})
+            self.assertEqual(cache.get('730d5fcb9bcba1b6b8d7d14ab9dff45031f194e5', 'tasks/other.yml', '-w'), set())
+
+    def test_get_missing(self):
+        with BlameCache(self.path) as cache:
+            cache.put('730d5fcb9bcba1b6b8d7d14ab9dff45031f194e5', 'tasks/main.yml', '-w', set())
+
+            self.assertIsNone(cache.get('730d5fcb9bcba1b6b8d7d14ab9dff45031f194e5', 'tasks/main.yml', ''))
+            self.assertIsNone(cache.get('730d5fcb9bcba1b6b8d7d14ab9dff45031f194e5', 'tasks/task1.yml', '-w'))
+            self.assertIsNone(cache.get('3de3d8c2bbccf62ef5698cf33ad258aae5316432', 'tasks/main.yml', '-w'))
+
+
+class ProductMetricsCacheTestSuite(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'cache.db')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_put_get(self):
+        with ProductMetricsCache(self.path) as cache:
+            cache.put('ce013625030ba8dba906f756967f9e9ca394464a', 'v1', {'lines_code': 10, 'text_entropy': 4.52})
+            cache.put('e69de29bb2d1d6434b8b29ae775ad8c2e48c5391', 'v1', {})
+
+        with ProductMetricsCache(self.path) as cache:
+            self.assertEqual(cache.get('ce013625030ba8dba906f756967f9e9ca394464a', 'v1'),
+                             {'lines_code': 10, 'text_entropy': 4.52})
+            self.assertEqual(cache.get('e69de29bb2d1d6434b8b29ae775ad8c2e48c5391', 'v1'), {})
+
+    def test_get_missing(self):
+        with ProductMetricsCache(self.path) as cache:
+            cache.put('ce013625030ba8dba906f756967f9e9ca394464a', 'v1', {'lines_code': 10})
+
+            self.assertIsNone(cache.get('ce013625030ba8dba906f756967f9e9ca394464a', 'v2'))
+            self.assertIsNone(cache.get('e69de29bb2d1d6434b8b29ae775ad8c2e48c5391', 'v1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 from repominer.files import FixedFile, FixedFileEncoder, FixedFileDecoder, FailureProneFile, FailureProneFileEncoder, \
-    FailureProneFileDecoder
+    FailureProneFileDecoder, LazyContent
 
 
 class TestFilesTestSuite(unittest.TestCase):
@@ -130,6 +130,20 @@ class TestFilesTestSuite(unittest.TestCase):
         decoded = FailureProneFileDecoder().to_object([lf1])
         assert decoded is None
 
+    # Tests for LazyContent class
+
+    def test_lazy_content(self):
+        calls = []
+        content = LazyContent(lambda: calls.append(1) or 'hosts: all')
+
+        assert not content.loaded
+        assert not calls
+
+        assert content() == 'hosts: all'
+        assert content() == 'hosts: all'
+        assert content.loaded
+        assert len(calls) == 1
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -16,6 +16,15 @@ class TestFiltersTestSuite(unittest.TestCase):
         assert not filters.is_ansible_file('test/task.yml')
         assert not filters.is_ansible_file('repominer/task.yml')
 
+    def test_is_ansible_file_none(self):
+        assert not filters.is_ansible_file(None)
+        assert not filters.is_ansible_file('')
+
+    def test_ansible_files_mask(self):
+        paths = ['playbooks/task.yml', 'test/task.yml', 'roles/x/tasks/main.yml', 'tasks/main.yaml', '']
+        assert filters.ansible_files_mask(paths) == [True, False, True, False, False]
+        assert filters.ansible_files_mask(paths) == [bool(filters.is_ansible_file(path)) for path in paths]
+
     def test_is_tosca_file_true(self):
         assert filters.is_tosca_file('service.tosca')
         assert filters.is_tosca_file('service.tosca.yaml')
@@ -36,6 +45,11 @@ class TestFiltersTestSuite(unittest.TestCase):
 
         assert not filters.is_tosca_file('service.yml', content=content)
 
+    def test_is_tosca_file_lazy_content(self):
+        assert filters.is_tosca_file('service.yml', content=lambda: 'tosca_definitions_version: tosca_simple_yaml_1_3')
+        assert not filters.is_tosca_file('service.tosca', content=lambda: 'description: not a TOSCA file')
+        assert filters.is_tosca_file('service.tosca', content=lambda: None)
+
 
 if __name__ == '__main__':
     unittest.main()
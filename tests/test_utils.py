@@ -1,3 +1,5 @@
+import subprocess
+import sys
 import unittest
 
 from repominer import utils
@@ -15,6 +17,38 @@ class UtilsTestSuite(unittest.TestCase):
     def test_get_dependents_empty():
         assert not utils.get_head_dependents('')
 
+    @staticmethod
+    def test_get_dependents_batch():
+        sentences = ['fix wrong condit when check the statu of mysqladmin that caus the output to be both in the case '
+                     'of success and failur of mysqladmin ping command ',
+                     '',
+                     'Fix nginx service that did not started the server']
+
+        assert utils.get_head_dependents_batch(sentences, batch_size=2) == [utils.get_head_dependents(sentence)
+                                                                          for sentence in sentences]
+
+    @staticmethod
+    def test_import_is_lazy():
+        code = 'import sys, repominer.mining.ansible, repominer.mining.tosca; ' \
+               'print(any(module in sys.modules for module in ("spacy", "nltk")))'
+        output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+        assert output.strip() == 'False'
+
+    @staticmethod
+    def test_get_nlp_version():
+        # spaCy is not imported, so that any version of its API is supported
+        code = 'import sys; sys.modules["spacy"] = None; from repominer import utils; print(utils.get_nlp_version())'
+        output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+        assert output.strip() == utils.get_nlp_version()
+        assert output.startswith('spacy==')
+        assert ' en_core_web_sm==' in output
+
+    @staticmethod
+    def test_warmup():
+        utils.warmup()
+        assert utils.get_nlp() is utils.get_nlp()
+        assert utils.nlp is utils.get_nlp()
+
     @staticmethod
     def test_key_value_list_continue():
         dict1 = {'key': None}